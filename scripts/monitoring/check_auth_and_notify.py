@@ -12,13 +12,13 @@ sys.path.insert(0, str(project_root))
 from playwright.sync_api import sync_playwright
 from src.config_loader import Config
 from src.auth import AuthHandler
-from src.notifications import NotificationSender
+from src.notifications import get_notification_sender
 
 def main():
     """Check authentication and send notification."""
     config = Config()
     auth_handler = AuthHandler(config)
-    notification = NotificationSender()
+    notification = get_notification_sender()
     
     print("=" * 60)
     print("Authentication Check with Notification")
@@ -62,7 +62,8 @@ def main():
     # Send notification
     print()
     print("Sending notification...")
-    notification_sent = notification.send_auth_status_notification(is_authenticated, details)
+    with notification:
+        notification_sent = notification.send_auth_status_notification(is_authenticated, details)
     
     if notification_sent:
         print("✅ Notification sent successfully")
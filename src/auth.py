@@ -1,13 +1,33 @@
 """Authentication handler for SSO using Playwright browser context persistence."""
 import json
 import logging
+import re
 from pathlib import Path
-from playwright.sync_api import Browser, BrowserContext, Page, sync_playwright
+from playwright.sync_api import Browser, BrowserContext, Page, Playwright, sync_playwright
 from typing import Optional
 from .config_loader import Config
 
 logger = logging.getLogger(__name__)
 
+# URL fragments that mean we've been bounced to the SSO sign-in page
+LOGIN_URL_PATTERN = re.compile(r'login|signin', re.IGNORECASE)
+
+# Init script that clicks the cookie-consent button as soon as the banner is
+# inserted. It runs before the parser has built <html>, so it observes the
+# document itself (documentElement is still null at that point).
+COOKIE_DISMISS_JS = """(selector => {
+    const dismiss = () => {
+        const button = document.querySelector(selector);
+        if (button) button.click();
+        return !!button;
+    };
+    if (dismiss()) return;
+    const observer = new MutationObserver(() => {
+        if (dismiss()) observer.disconnect();
+    });
+    observer.observe(document, {childList: true, subtree: true});
+})(%s);"""
+
 
 class AuthHandler:
     """Handles SSO authentication with persistent browser context."""
@@ -17,12 +37,18 @@ class AuthHandler:
         self.config = config
         self.browser_state_path = config.get_browser_state_path()
         self.browser_state_file = config.get_browser_state_file()
+        # mtime of the state file whose cookies the persistent profile last took
+        self._applied_state_mtime = None
         self._ensure_directories()
     
     def _ensure_directories(self):
         """Ensure browser state directory exists."""
         self.browser_state_path.mkdir(parents=True, exist_ok=True)
     
+    def _install_cookie_dismisser(self, context: BrowserContext):
+        """Dismiss the cookie-consent banner client-side on every page load."""
+        context.add_init_script(COOKIE_DISMISS_JS % json.dumps(self.config.selectors['cookie_button']))
+    
     def create_browser_context(self, browser: Browser, headless: bool = False) -> BrowserContext:
         """Create or load browser context with persistent state."""
         state_file = self.browser_state_file
@@ -39,6 +65,7 @@ class AuthHandler:
                     viewport=viewport_size
                 )
                 logger.info("Browser state loaded successfully")
+                self._install_cookie_dismisser(context)
                 return context
             except Exception as e:
                 logger.warning(f"Failed to load browser state: {e}. Creating new context.")
@@ -48,14 +75,63 @@ class AuthHandler:
         context = browser.new_context(
             viewport=viewport_size
         )
+        self._install_cookie_dismisser(context)
+        return context
+    
+    def open_persistent_context(self, playwright: Playwright, headless: bool = False) -> BrowserContext:
+        """Launch Chromium on an on-disk profile so cookies and HTTP cache survive between runs.
+        
+        Only the scheduler uses this: Chromium locks the profile directory, so
+        it can be open in one process at a time. Other modes use
+        create_browser_context and the saved state file instead.
+        
+        Cookies from the saved browser state file are applied on top, so a
+        state file refreshed by --authenticate or the keep-alive job (or copied
+        to the VM) still wins over whatever the profile last held.
+        """
+        profile_dir = self.browser_state_path / "profile"
+        
+        logger.info(f"Opening persistent browser profile at {profile_dir}")
+        context = playwright.chromium.launch_persistent_context(
+            str(profile_dir),
+            headless=headless,
+            viewport={'width': 1280, 'height': 800}
+        )
+        self._install_cookie_dismisser(context)
+        self._applied_state_mtime = None
+        self.refresh_saved_cookies(context)
+        
         return context
     
+    def refresh_saved_cookies(self, context: BrowserContext):
+        """Apply the saved browser state's cookies if the file changed since they were last applied.
+        
+        Lets a long-running persistent context pick up a re-authentication
+        done by another process (--authenticate, the keep-alive job).
+        """
+        try:
+            mtime = self.browser_state_file.stat().st_mtime
+        except FileNotFoundError:
+            return
+        if mtime == self._applied_state_mtime:
+            return
+        
+        try:
+            with open(self.browser_state_file, 'r') as f:
+                context.add_cookies(json.load(f).get('cookies', []))
+            self._applied_state_mtime = mtime
+            logger.info("Applied cookies from saved browser state")
+        except Exception as e:
+            logger.warning(f"Failed to apply saved browser state cookies: {e}")
+    
     def save_browser_state(self, context: BrowserContext):
         """Save browser context state for future use."""
         try:
             state = context.storage_state()
             with open(self.browser_state_file, 'w') as f:
                 json.dump(state, f, indent=2)
+            # These are the context's own cookies; nothing to re-apply
+            self._applied_state_mtime = self.browser_state_file.stat().st_mtime
             logger.info(f"Browser state saved to {self.browser_state_file}")
         except Exception as e:
             logger.error(f"Failed to save browser state: {e}")
@@ -71,7 +147,7 @@ class AuthHandler:
             # Button ID: btnProfile - this is always present when authenticated
             try:
                 profile_button = page.query_selector('#btnProfile')
-                if profile_button and profile_button.is_visible(timeout=500):  # Reduced timeout
+                if profile_button and profile_button.is_visible():
                     logger.debug("Authentication check: Found profile button (#btnProfile) - user IS authenticated")
                     return True
             except Exception:
@@ -80,22 +156,21 @@ class AuthHandler:
             # Quick check for "Sign in" (not authenticated) - do this early
             try:
                 sign_in_element = page.get_by_text("Sign in", exact=False).first
-                if sign_in_element.is_visible(timeout=500):  # Reduced timeout
+                if sign_in_element.is_visible():
                     logger.debug("Authentication check: Found 'Sign in' - user is NOT authenticated")
                     return False
             except Exception:
                 pass
             
             # Check URL as fast fallback
-            current_url = page.url.lower()
-            if 'login' in current_url or 'signin' in current_url:
+            if LOGIN_URL_PATTERN.search(page.url):
                 logger.debug("Authentication check: On login page - user is NOT authenticated")
                 return False
             
             # FALLBACK: Check for user name text (only if profile button not found)
             try:
                 user_name_element = page.get_by_text("Oishik Saha", exact=False).first
-                if user_name_element.is_visible(timeout=500):  # Reduced timeout
+                if user_name_element.is_visible():
                     logger.debug("Authentication check: Found 'Oishik Saha' text - user IS authenticated")
                     return True
             except Exception:
@@ -162,13 +237,13 @@ class AuthHandler:
         # Navigate to booking page - use 'domcontentloaded' for faster initial load
         page.goto(self.config.booking_url, wait_until='domcontentloaded', timeout=10000)
         
-        # Handle cookie consent if present (quick check, don't wait long)
+        # Fallback for the cookie init script: accept the banner if it is still showing
         try:
             cookie_button = page.query_selector(self.config.selectors['cookie_button'])
-            if cookie_button and cookie_button.is_visible(timeout=1000):
+            if cookie_button and cookie_button.is_visible():
                 cookie_button.click()
-                logger.debug("Cookie consent accepted")
-                page.wait_for_timeout(500)  # Reduced wait after cookie click
+                logger.debug("Cookie consent accepted (init script had not dismissed it)")
+                page.wait_for_timeout(500)
         except Exception:
             pass  # Cookie button not needed or not found
         
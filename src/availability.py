@@ -45,15 +45,6 @@ def check_availability(config: Config, days_ahead: int = 7):
             page.goto(config.booking_url, wait_until='networkidle')
             page.wait_for_timeout(2000)
             
-            # Handle cookie consent
-            try:
-                cookie_button = page.query_selector(config.selectors['cookie_button'])
-                if cookie_button and cookie_button.is_visible():
-                    cookie_button.click()
-                    page.wait_for_timeout(1000)
-            except Exception:
-                pass
-            
             # Get available courts
             courts = booking_engine.get_available_courts(page)
             if not courts:
@@ -1,27 +1,96 @@
 """Core booking engine using Playwright."""
+from __future__ import annotations
+
 import logging
+import re
+import time
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from playwright.sync_api import Page, TimeoutError as PlaywrightTimeoutError
 from .config_loader import Config
 
 logger = logging.getLogger(__name__)
 
+# Time range in slot headers, e.g. "7:00 AM - 8:00 AM"
+TIME_RANGE_PATTERN = re.compile(r'(\d{1,2}:\d{2}\s*(?:AM|PM))\s*-\s*(\d{1,2}:\d{2}\s*(?:AM|PM))')
+
+# Checkout chain after selecting a slot: (selector key, click via element.click() in JS)
+CHECKOUT_STEPS = (
+    ('register_button', True),
+    ('proceed_to_checkout', True),
+    ('checkout_button', False),
+    ('final_checkout', False),
+)
+
+# Reads [text, href] for every court link in one round-trip
+COURT_LINKS_JS = "els => els.map(el => [el.innerText, el.getAttribute('href')])"
+
+# Reads every bookable slot card in one round-trip. Cards and select buttons are
+# paired by position; full cards, disabled buttons and cards without a spots tag
+# or time header are skipped.
+OPEN_SLOTS_JS = """sel => {
+    const cards = document.querySelectorAll(sel.card);
+    const buttons = document.querySelectorAll(sel.button);
+    const slots = [];
+    cards.forEach((card, index) => {
+        const button = buttons[index];
+        if (!button) return;
+        const spots = card.querySelector(sel.spots);
+        if (!spots) return;
+        const spotsText = spots.innerText.trim();
+        const disabled = button.disabled || button.getAttribute('aria-disabled') === 'true';
+        if (spotsText.includes('No Spots Left') || disabled) return;
+        const time = card.querySelector(sel.time);
+        if (!time) return;
+        const location = card.querySelector(sel.location);
+        const p = location && location.querySelector('p');
+        slots.push({
+            index: index,
+            time: time.innerText.trim(),
+            court_name: p ? p.innerText.replace('location_on', '').trim() : 'Unknown',
+            spots_text: spotsText,
+        });
+    });
+    return slots;
+}"""
+
 
 class BookingEngine:
     """Handles the core booking logic."""
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config) -> None:
         """Initialize booking engine."""
         self.config = config
         self.selectors = config.selectors
         self.booking_window_days = config.booking_window_days
+        self.base_url = config.urls['base']
         self.timeout = config.booking['timeout_seconds'] * 1000  # Convert to milliseconds
+        self._ready_marker = self.selectors.get('ready_marker', self.selectors['court_link'])
+        self._open_slots_args = {
+            'card': self.selectors['time_slot_card'],
+            'button': self.selectors['select_button'],
+            'spots': self.selectors['spots_tag'],
+            'time': self.selectors['instance_time'],
+            'location': self.selectors['location_div'],
+        }
+        # Resolve checkout selectors once so book_slot doesn't re-index config per step
+        # (and a missing selector fails here rather than halfway through a checkout)
+        self._checkout_steps = tuple(
+            (self.selectors[key], js_click) for key, js_click in CHECKOUT_STEPS
+        )
+        # Per-run booking stats, keyed by (result, court_name); summarized once per attempt_booking
+        self.stats: Counter[Tuple[str, str]] = Counter()
+        self.book_latencies: List[float] = []
+        # Last error hit while checking a court in the current run ("court: error"),
+        # so a run where courts fail isn't reported as an ordinary full day
+        self.last_court_error: Optional[str] = None
     
     def navigate_to_target_date(self, page: Page, target_date: datetime) -> bool:
         """Navigate to the target date in the booking interface."""
+        date_str = target_date.strftime('%Y-%m-%d')
         try:
-            logger.info(f"Navigating to target date: {target_date.strftime('%Y-%m-%d')}")
+            logger.info(f"Navigating to target date: {date_str}")
             
             # Wait for page to load
             page.wait_for_timeout(2000)
@@ -29,7 +98,7 @@ class BookingEngine:
             # Check if page shows "no instances available" - fail fast if so
             try:
                 no_instances_text = page.get_by_text("no instances available", exact=False).first
-                if no_instances_text.is_visible(timeout=1000):
+                if no_instances_text.is_visible():
                     logger.warning(f"Page shows 'no instances available' - skipping date navigation")
                     return False
             except Exception:
@@ -89,7 +158,7 @@ class BookingEngine:
                     return True
                 except PlaywrightTimeoutError:
                     logger.warning(f"Target date button still not visible after alternative attempts")
-                    logger.warning(f"Date {target_date.strftime('%Y-%m-%d')} may not be available or page structure changed")
+                    logger.warning(f"Date {date_str} may not be available or page structure changed")
                     return False
                 except Exception as e:
                     logger.warning(f"Error clicking target date button: {e}")
@@ -128,9 +197,7 @@ class BookingEngine:
             
             # Extract just the time range (e.g., "7:00 AM - 8:00 AM")
             # Look for pattern like "X:XX AM/PM - X:XX AM/PM"
-            import re
-            time_pattern = r'(\d{1,2}:\d{2}\s*(?:AM|PM))\s*-\s*(\d{1,2}:\d{2}\s*(?:AM|PM))'
-            match = re.search(time_pattern, cleaned)
+            match = TIME_RANGE_PATTERN.search(cleaned)
             
             if not match:
                 logger.debug(f"Could not find time pattern in: '{time_text}'")
@@ -169,16 +236,15 @@ class BookingEngine:
         """Get all available courts and their links."""
         courts = {}
         try:
-            court_elements = page.query_selector_all(self.selectors['court_link'])
+            court_elements = page.eval_on_selector_all(self.selectors['court_link'], COURT_LINKS_JS)
             logger.info(f"Found {len(court_elements)} courts")
             
-            # Get base URL for relative links
-            base_url = self.config.urls['base']
+            # Base URL for relative links
+            base_url = self.base_url
             
-            for element in court_elements:
+            for court_text, court_link in court_elements:
                 try:
-                    court_name = element.inner_text().split('\n')[0].strip()
-                    court_link = element.get_attribute('href')
+                    court_name = (court_text or '').split('\n')[0].strip()
                     if court_name and court_link:
                         # Convert relative URLs to absolute
                         if court_link.startswith('/'):
@@ -187,7 +253,7 @@ class BookingEngine:
                             court_link = base_url + '/' + court_link
                         
                         courts[court_name] = court_link
-                        logger.debug(f"Found court: {court_name} -> {court_link}")
+                        logger.debug("Found court: %s -> %s", court_name, court_link)
                 except Exception as e:
                     logger.warning(f"Error extracting court info: {e}")
             
@@ -196,11 +262,15 @@ class BookingEngine:
         
         return courts
     
+    def _extract_open_slots(self, page: Page) -> List[Dict[str, Any]]:
+        """Read every bookable slot on the current court/date page (index, time, court_name, spots_text)."""
+        return page.evaluate(OPEN_SLOTS_JS, self._open_slots_args)
+    
     def find_available_slots(
         self,
         page: Page,
         target_times: List[str]
-    ) -> List[Dict[str, any]]:
+    ) -> List[Dict[str, Any]]:
         """Find available time slots matching target times.
         
         Optimized: Collects all available slots first, then filters by target times.
@@ -216,62 +286,9 @@ class BookingEngine:
             )
             page.wait_for_timeout(2000)  # Additional wait for dynamic content
             
-            time_slots = page.query_selector_all(self.selectors['time_slot_card'])
-            logger.info(f"Found {len(time_slots)} time slots for this court")
-            
-            select_buttons = page.query_selector_all(self.selectors['select_button'])
-            
             # First pass: Collect ALL available slots (regardless of time)
-            # This is faster than filtering during iteration
-            for index in range(len(time_slots)):
-                try:
-                    if index >= len(select_buttons):
-                        continue
-                    
-                    time_slot = time_slots[index]
-                    select_button = select_buttons[index]
-                    
-                    # Check availability
-                    spots_element = time_slot.query_selector(self.selectors['spots_tag'])
-                    if not spots_element:
-                        continue
-                    
-                    spots_text = spots_element.inner_text().strip()
-                    
-                    # Check if button is disabled
-                    is_disabled = select_button.is_disabled()
-                    
-                    # Check if slot is available
-                    if "No Spots Left" in spots_text or is_disabled:
-                        continue
-                    
-                    # Get time
-                    time_element = time_slot.query_selector(self.selectors['instance_time'])
-                    if not time_element:
-                        continue
-                    
-                    time_text = time_element.inner_text().strip()
-                    
-                    # Get court name
-                    location_div = time_slot.query_selector(self.selectors['location_div'])
-                    court_name = "Unknown"
-                    if location_div:
-                        p_tag = location_div.query_selector('p')
-                        if p_tag:
-                            court_name = p_tag.inner_text().replace("location_on", "").strip()
-                    
-                    slot_info = {
-                        'index': index,
-                        'time': time_text,
-                        'court_name': court_name,
-                        'spots_text': spots_text,
-                    }
-                    
-                    all_available_slots.append(slot_info)
-                    
-                except Exception as e:
-                    logger.debug(f"Error processing time slot {index}: {e}")
-                    continue
+            all_available_slots = self._extract_open_slots(page)
+            logger.info(f"Found {len(all_available_slots)} open time slots for this court")
             
             # Second pass: Filter by target times (faster than checking during iteration)
             matching_slots = []
@@ -281,22 +298,21 @@ class BookingEngine:
             logger.info(f"Target times: {target_times}")
             logger.info(f"Available slot times: {available_times[:10]}")  # Show first 10
             
+            # Only format the per-slot debug lines when DEBUG is actually on
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
             for slot in all_available_slots:
                 # Parse and log for debugging
                 parsed = self.parse_time_slot(slot['time'])
-                if parsed:
-                    parsed_str = parsed.strftime("%H:%M")
-                    logger.debug(f"Slot '{slot['time']}' -> '{parsed_str}' (targets: {target_times})")
-                else:
+                if not parsed:
                     logger.warning(f"Failed to parse time slot: '{slot['time']}'")
+                elif debug_enabled:
+                    logger.debug("Slot '%s' -> '%s' (targets: %s)", slot['time'], parsed.strftime("%H:%M"), target_times)
                 
                 if self.time_matches_target(slot['time'], target_times):
                     matching_slots.append(slot)
                     logger.info(f"✓ MATCH: {slot['time']} at {slot['court_name']}")
-                else:
-                    if parsed:
-                        parsed_str = parsed.strftime("%H:%M")
-                        logger.debug(f"✗ No match: '{slot['time']}' ({parsed_str}) not in {target_times}")
+                elif parsed and debug_enabled:
+                    logger.debug("✗ No match: '%s' (%s) not in %s", slot['time'], parsed.strftime("%H:%M"), target_times)
             
             logger.info(f"Court has {len(all_available_slots)} available slots, {len(matching_slots)} match target times")
             if len(all_available_slots) > 0 and len(matching_slots) == 0:
@@ -311,17 +327,27 @@ class BookingEngine:
         
         return []
     
-    def find_all_available_slots_for_date(self, page: Page, target_date: datetime) -> List[Dict[str, any]]:
+    def find_all_available_slots_for_date(
+        self,
+        page: Page,
+        target_date: datetime,
+        navigate: bool = True
+    ) -> List[Dict[str, Any]]:
         """Find ALL available time slots for a given date (not filtered by target times).
         
+        Pass navigate=False when the caller has already selected the date
+        (e.g. with navigate_to_target_date_fast), to skip a second date click.
         Returns a list of all available slots with their details.
         """
         all_available_slots = []
+        # Formatted once: used for every slot and log line below
+        date_str = target_date.strftime('%Y-%m-%d')
+        date_display = target_date.strftime('%b %d, %Y')
         
         try:
             # Navigate to target date
-            if not self.navigate_to_target_date(page, target_date):
-                logger.debug(f"Could not navigate to date {target_date.strftime('%Y-%m-%d')}")
+            if navigate and not self.navigate_to_target_date(page, target_date):
+                logger.debug(f"Could not navigate to date {date_str}")
                 return []
             
             # Wait for time slots to load
@@ -332,72 +358,19 @@ class BookingEngine:
                 )
                 page.wait_for_timeout(2000)  # Additional wait for dynamic content
             except PlaywrightTimeoutError:
-                logger.debug(f"No time slots found for date {target_date.strftime('%Y-%m-%d')}")
+                logger.debug(f"No time slots found for date {date_str}")
                 return []
             
-            time_slots = page.query_selector_all(self.selectors['time_slot_card'])
-            logger.debug(f"Found {len(time_slots)} time slots for date {target_date.strftime('%Y-%m-%d')}")
-            
-            select_buttons = page.query_selector_all(self.selectors['select_button'])
-            
-            # Collect ALL available slots
-            for index in range(len(time_slots)):
-                try:
-                    if index >= len(select_buttons):
-                        continue
-                    
-                    time_slot = time_slots[index]
-                    select_button = select_buttons[index]
-                    
-                    # Check availability
-                    spots_element = time_slot.query_selector(self.selectors['spots_tag'])
-                    if not spots_element:
-                        continue
-                    
-                    spots_text = spots_element.inner_text().strip()
-                    
-                    # Check if button is disabled
-                    is_disabled = select_button.is_disabled()
-                    
-                    # Check if slot is available
-                    if "No Spots Left" in spots_text or is_disabled:
-                        continue
-                    
-                    # Get time
-                    time_element = time_slot.query_selector(self.selectors['instance_time'])
-                    if not time_element:
-                        continue
-                    
-                    time_text = time_element.inner_text().strip()
-                    
-                    # Get court name
-                    location_div = time_slot.query_selector(self.selectors['location_div'])
-                    court_name = "Unknown"
-                    if location_div:
-                        p_tag = location_div.query_selector('p')
-                        if p_tag:
-                            court_name = p_tag.inner_text().replace("location_on", "").strip()
-                    
-                    slot_info = {
-                        'index': index,
-                        'time': time_text,
-                        'court_name': court_name,
-                        'spots_text': spots_text,
-                        'date': target_date.strftime('%Y-%m-%d'),
-                        'date_display': target_date.strftime('%b %d, %Y')
-                    }
-                    
-                    all_available_slots.append(slot_info)
-                    
-                except Exception as e:
-                    logger.debug(f"Error processing time slot {index}: {e}")
-                    continue
+            all_available_slots = self._extract_open_slots(page)
+            for slot_info in all_available_slots:
+                slot_info['date'] = date_str
+                slot_info['date_display'] = date_display
             
-            logger.debug(f"Found {len(all_available_slots)} available slots for {target_date.strftime('%Y-%m-%d')}")
+            logger.debug(f"Found {len(all_available_slots)} available slots for {date_str}")
             return all_available_slots
             
         except Exception as e:
-            logger.error(f"Error finding slots for date {target_date.strftime('%Y-%m-%d')}: {e}")
+            logger.error(f"Error finding slots for date {date_str}: {e}")
             return []
     
     def get_available_dates(self, page: Page, days_ahead: int) -> List[datetime]:
@@ -464,7 +437,7 @@ class BookingEngine:
             # Quick check if button exists and is visible
             try:
                 target_button = page.locator(target_xpath).first
-                if not target_button.is_visible(timeout=2000):
+                if not target_button.is_visible():
                     return False
                 
                 # Click immediately
@@ -478,7 +451,97 @@ class BookingEngine:
             logger.debug(f"Fast date navigation failed: {e}")
             return False
     
-    def book_slot(self, page: Page, slot_info: Dict) -> bool:
+    def _open_court_date(self, page: Page, court_name: str, court_link: str, target_date: datetime) -> bool:
+        """Navigate to a court page and select the target date. Returns False if the court should be skipped."""
+        # Navigate to court page with timeout
+        page.goto(court_link, wait_until='networkidle', timeout=15000)
+        page.wait_for_timeout(2000)
+        
+        # Check if page shows "no instances available" - skip this court quickly
+        try:
+            no_instances = page.get_by_text("no instances available", exact=False).first
+            if no_instances.is_visible():
+                logger.info(f"Court {court_name} shows 'no instances available' - skipping")
+                return False
+        except Exception:
+            pass
+        
+        # Navigate to target date
+        if not self.navigate_to_target_date(page, target_date):
+            logger.warning(f"Could not navigate to target date for {court_name} - skipping")
+            return False
+        return True
+    
+    def _order_courts(self, courts: Dict[str, str], court_preference: str) -> List[str]:
+        """Order court names so preferred courts (if configured) are tried first."""
+        preferred = self.config.preferred_courts
+        if court_preference == "any" or not preferred:
+            return list(courts)
+        rank = {name: i for i, name in enumerate(preferred)}
+        return sorted(courts, key=lambda name: rank.get(name, len(rank)))
+    
+    def _slot_priority(self, slot: Dict[str, Any], target_times: List[str]) -> int:
+        """Rank a slot by the position of its start time in target_times (lower is better)."""
+        parsed = self.parse_time_slot(slot['time'])
+        if parsed is None:
+            return len(target_times)
+        time_str = parsed.strftime("%H:%M")
+        return target_times.index(time_str) if time_str in target_times else len(target_times)
+    
+    def iter_candidate_slots(
+        self,
+        page: Page,
+        courts: Dict[str, str],
+        target_times: List[str],
+        court_preference: str = "any"
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield bookable slots matching target times, best candidates first.
+        
+        Courts are visited in preference order and each court's matching slots are
+        yielded in target-time order. While a slot is yielded the page is positioned
+        on its court and date, so the caller can book it directly. If the caller
+        resumes the generator (the booking failed), the court page is reopened before
+        the next slot from the same court is yielded, reusing the slots already scraped.
+        """
+        target_date = self.get_target_date()
+        date_str = target_date.strftime('%Y-%m-%d')
+        
+        for court_name in self._order_courts(courts, court_preference):
+            court_link = courts[court_name]
+            try:
+                logger.info(f"Checking court: {court_name}")
+                if not self._open_court_date(page, court_name, court_link, target_date):
+                    continue
+                
+                # Find available slots
+                available_slots = self.find_available_slots(page, target_times)
+            except Exception as e:
+                logger.warning(f"Error processing court {court_name}: {e}")
+                self.last_court_error = f"{court_name}: {e}"
+                continue
+            
+            if not available_slots:
+                logger.info(f"No available slots at target times for {court_name}")
+                continue
+            
+            available_slots.sort(key=lambda s: self._slot_priority(s, target_times))
+            
+            for position, slot in enumerate(available_slots):
+                if position > 0:
+                    # Previous attempt left the page mid-checkout - reopen the court date
+                    try:
+                        if not self._open_court_date(page, court_name, court_link, target_date):
+                            break
+                    except Exception as e:
+                        logger.warning(f"Error reopening court {court_name}: {e}")
+                        self.last_court_error = f"{court_name}: {e}"
+                        break
+                
+                slot['court_link'] = court_link
+                slot['date'] = date_str
+                yield slot
+    
+    def book_slot(self, page: Page, slot_info: Dict[str, Any]) -> bool:
         """Book a specific time slot. Returns True if successful."""
         try:
             index = slot_info['index']
@@ -515,38 +578,15 @@ class BookingEngine:
             
             # Click select button
             page.evaluate("(element) => element.click()", select_button)
-            page.wait_for_timeout(2000)
-            
-            # Click register button
-            register_button = page.wait_for_selector(
-                self.selectors['register_button'],
-                timeout=self.timeout
-            )
-            page.evaluate("(element) => element.click()", register_button)
-            page.wait_for_timeout(2000)
-            
-            # Proceed to checkout
-            proceed_button = page.wait_for_selector(
-                self.selectors['proceed_to_checkout'],
-                timeout=self.timeout
-            )
-            page.evaluate("(element) => element.click()", proceed_button)
-            page.wait_for_timeout(2000)
-            
-            # Checkout
-            checkout_button = page.wait_for_selector(
-                self.selectors['checkout_button'],
-                timeout=self.timeout
-            )
-            checkout_button.click()
-            page.wait_for_timeout(2000)
             
-            # Final checkout
-            final_checkout = page.wait_for_selector(
-                self.selectors['final_checkout'],
-                timeout=self.timeout
-            )
-            final_checkout.click()
+            # Walk the checkout chain. Each step waits for its own button to appear,
+            # so no fixed sleep is needed between clicks.
+            for selector, js_click in self._checkout_steps:
+                button = page.wait_for_selector(selector, timeout=self.timeout)
+                if js_click:
+                    page.evaluate("(element) => element.click()", button)
+                else:
+                    button.click()
             page.wait_for_timeout(3000)  # Wait for confirmation
             
             logger.info(f"Successfully booked: {time_text} at {court_name}")
@@ -566,8 +606,37 @@ class BookingEngine:
         court_preference: str = "any"
     ) -> Optional[Dict[str, str]]:
         """Attempt to book a court at one of the target times."""
+        self.stats.clear()
+        self.book_latencies.clear()
+        self.last_court_error = None
+        try:
+            return self._attempt_booking(page, target_times, court_preference)
+        finally:
+            self._log_stats_summary()
+    
+    def _log_stats_summary(self) -> None:
+        """Log one summary line for the per-court booking stats of the last run."""
+        totals: Counter[str] = Counter()
+        for (result, _court), count in self.stats.items():
+            totals[result] += count
+        if self.book_latencies:
+            latency = f"{sum(self.book_latencies) / len(self.book_latencies):.2f}s avg, {max(self.book_latencies):.2f}s max"
+        else:
+            latency = "n/a"
+        logger.info(
+            f"Booking stats: attempts={totals['attempts']} successes={totals['successes']} "
+            f"failures={totals['failures']} book_latency={latency}"
+        )
+    
+    def _attempt_booking(
+        self,
+        page: Page,
+        target_times: List[str],
+        court_preference: str
+    ) -> Optional[Dict[str, str]]:
+        """Run the retry loop for attempt_booking."""
         max_retries = self.config.booking['max_retries']
-        retry_delay = self.config.booking['retry_delay_seconds'] * 1000
+        retry_delay = self.config.booking['retry_delay_seconds']
         
         # Check if test mode is enabled and override settings
         if self.config.test_mode_enabled:
@@ -580,18 +649,13 @@ class BookingEngine:
             try:
                 logger.info(f"Booking attempt {attempt + 1}/{max_retries}")
                 
-                # Navigate to program page
-                page.goto(self.config.booking_url, wait_until='networkidle', timeout=15000)
-                page.wait_for_timeout(2000)
-                
-                # Handle cookie consent
+                # Navigate to program page and wait only for the court list, not for
+                # every analytics beacon to go quiet
+                page.goto(self.config.booking_url, wait_until='domcontentloaded', timeout=15000)
                 try:
-                    cookie_button = page.query_selector(self.config.selectors['cookie_button'])
-                    if cookie_button and cookie_button.is_visible():
-                        cookie_button.click()
-                        page.wait_for_timeout(1000)
-                except Exception:
-                    pass
+                    page.wait_for_selector(self._ready_marker, state='visible', timeout=15000)
+                except PlaywrightTimeoutError:
+                    logger.warning("Program page did not show any courts within 15s")
                 
                 # Get available courts
                 courts = self.get_available_courts(page)
@@ -615,68 +679,39 @@ class BookingEngine:
                 found_any_slots = False
                 booking_error = False
                 
-                # Try each court
-                for court_name, court_link in courts.items():
-                    try:
-                        logger.info(f"Checking court: {court_name}")
-                        
-                        # Navigate to court page with timeout
-                        page.goto(court_link, wait_until='networkidle', timeout=15000)
-                        page.wait_for_timeout(2000)
-                        
-                        # Check if page shows "no instances available" - skip this court quickly
-                        try:
-                            no_instances = page.get_by_text("no instances available", exact=False).first
-                            if no_instances.is_visible(timeout=1000):
-                                logger.info(f"Court {court_name} shows 'no instances available' - skipping")
-                                continue
-                        except Exception:
-                            pass
-                        
-                        # Navigate to target date
-                        target_date = self.get_target_date()
-                        if not self.navigate_to_target_date(page, target_date):
-                            logger.warning(f"Could not navigate to target date for {court_name} - skipping")
-                            continue
-                        
-                        # Find available slots
-                        available_slots = self.find_available_slots(page, target_times)
-                        
-                        if not available_slots:
-                            logger.info(f"No available slots at target times for {court_name}")
-                            continue
-                        
-                        found_any_slots = True
-                        
-                        # Book the first available slot
-                        slot = available_slots[0]
-                        logger.info(f"Attempting to book: {slot['time']} at {slot['court_name']}")
-                        if self.book_slot(page, slot):
-                            return {
-                                'time': slot['time'],
-                                'court_name': slot['court_name'],
-                                'date': target_date.strftime('%Y-%m-%d')
-                            }
-                        else:
-                            # Booking failed but slot was available - might be worth retrying
-                            booking_error = True
-                            logger.warning(f"Booking failed for {slot['time']} at {slot['court_name']}")
-                        
-                    except Exception as e:
-                        logger.warning(f"Error processing court {court_name}: {e}")
-                        booking_error = True
-                        continue
+                # Try candidate slots in priority order; the generator keeps the page
+                # positioned on the slot's court and date while we attempt it
+                for slot in self.iter_candidate_slots(page, courts, target_times, court_preference):
+                    found_any_slots = True
+                    court = slot['court_name']
+                    self.stats['attempts', court] += 1
+                    started = time.perf_counter()
+                    booked = self.book_slot(page, slot)
+                    self.book_latencies.append(time.perf_counter() - started)
+                    if booked:
+                        self.stats['successes', court] += 1
+                        return {
+                            'time': slot['time'],
+                            'court_name': slot['court_name'],
+                            'date': slot['date']
+                        }
+                    # Booking failed but slot was available - might be worth retrying
+                    booking_error = True
+                    self.stats['failures', court] += 1
                 
                 # Decision: Only retry if there was a booking error, not if no slots were found
                 if found_any_slots and booking_error:
                     # We found slots but booking failed - retry might help
                     if attempt < max_retries - 1:
-                        logger.info(f"Found slots but booking failed. Retrying in {retry_delay/1000} seconds...")
-                        page.wait_for_timeout(retry_delay)
+                        logger.info(f"Found slots but booking failed. Retrying in {retry_delay} seconds...")
+                        time.sleep(retry_delay)
                         continue
                 elif not found_any_slots:
                     # No slots found at all - don't retry, just return
-                    logger.info("No available slots found at target times across all courts")
+                    if self.last_court_error:
+                        logger.warning(f"No slots found, but checking courts hit errors (last: {self.last_court_error})")
+                    else:
+                        logger.info("No available slots found at target times across all courts")
                     return None
                 else:
                     # Shouldn't reach here, but if we do, don't retry
@@ -686,8 +721,9 @@ class BookingEngine:
                 logger.error(f"Error in booking attempt {attempt + 1}: {e}")
                 # Only retry on actual errors, not on "no slots found"
                 if attempt < max_retries - 1:
-                    logger.info(f"Retrying due to error in {retry_delay/1000} seconds...")
-                    page.wait_for_timeout(retry_delay)
+                    logger.info(f"Retrying due to error in {retry_delay} seconds...")
+                    # Sleep on our side: the page may be the thing that just failed
+                    time.sleep(retry_delay)
         
         logger.warning("All booking attempts completed")
         return None
@@ -10,14 +10,28 @@ To use this, you would need to:
 Status: Future feature, not actively used.
 """
 import logging
+import time
+from bisect import bisect_left
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 from msal import ConfidentialClientApplication
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from .config_loader import Config
 
 logger = logging.getLogger(__name__)
 
+# Use the ciso8601 C parser for Graph timestamps if installed (optional)
+try:
+    from ciso8601 import parse_datetime as parse_graph_datetime
+except ImportError:
+    def parse_graph_datetime(value: str) -> datetime:
+        """Parse a Graph ISO-8601 timestamp, accepting a trailing 'Z' for UTC."""
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        return datetime.fromisoformat(value)
+
 
 class OutlookCalendar:
     """Microsoft Outlook calendar integration using Microsoft Graph API."""
@@ -37,20 +51,43 @@ class OutlookCalendar:
         self.scope = ["https://graph.microsoft.com/.default"]
         self.graph_endpoint = "https://graph.microsoft.com/v1.0"
         self._access_token = None
+        self._token_expiry = 0.0  # time.monotonic() deadline for _access_token
+        self._app = None  # MSAL app, created on first use and reused for its token cache
+        
+        # One keep-alive session for all Graph calls instead of a new TLS connection per request
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=2, pool_maxsize=8, max_retries=Retry(total=2, backoff_factor=0.2))
+        )
+        self._session.headers["Content-Type"] = "application/json"
     
     def get_access_token(self) -> Optional[str]:
-        """Get access token for Microsoft Graph API."""
+        """Get access token for Microsoft Graph API.
+        
+        Reuses the current token until shortly before it expires.
+        """
+        if self._access_token and time.monotonic() < self._token_expiry:
+            return self._access_token
+        
         try:
-            app = ConfidentialClientApplication(
-                client_id=self.client_id,
-                client_credential=self.client_secret,
-                authority=self.authority
-            )
+            if self._app is None:
+                self._app = ConfidentialClientApplication(
+                    client_id=self.client_id,
+                    client_credential=self.client_secret,
+                    authority=self.authority
+                )
             
-            result = app.acquire_token_for_client(scopes=self.scope)
+            # MSAL's in-memory cache answers without a network call while the token is valid
+            result = self._app.acquire_token_silent(self.scope, account=None)
+            if not result:
+                result = self._app.acquire_token_for_client(scopes=self.scope)
             
             if "access_token" in result:
                 self._access_token = result["access_token"]
+                self._session.headers["Authorization"] = f"Bearer {self._access_token}"
+                # Refresh a minute early so a request never goes out with an expiring token
+                self._token_expiry = time.monotonic() + int(result.get("expires_in", 3600)) - 60
                 return self._access_token
             else:
                 logger.error(f"Failed to acquire token: {result.get('error_description')}")
@@ -76,10 +113,9 @@ class OutlookCalendar:
         Returns:
             List of calendar events
         """
-        if not self._access_token:
-            if not self.get_access_token():
-                logger.error("Failed to get access token")
-                return []
+        if not self.get_access_token():
+            logger.error("Failed to get access token")
+            return []
         
         try:
             # Format dates for API
@@ -91,18 +127,22 @@ class OutlookCalendar:
             params = {
                 "startDateTime": start_str,
                 "endDateTime": end_str,
-                "$orderby": "start/dateTime"
-            }
-            
-            headers = {
-                "Authorization": f"Bearer {self._access_token}",
-                "Content-Type": "application/json"
+                "$orderby": "start/dateTime",
+                # Only the fields get_busy_times reads; skips bodies, attendees, etc.
+                "$select": "subject,start,end,location",
+                "$top": 200
             }
             
-            response = requests.get(url, headers=headers, params=params)
-            response.raise_for_status()
-            
-            events = response.json().get("value", [])
+            # Follow @odata.nextLink so events past the first page aren't dropped
+            # (the nextLink already carries the query parameters)
+            events = []
+            while url:
+                response = self._session.get(url, params=params, timeout=10)
+                response.raise_for_status()
+                page = response.json()
+                events.extend(page.get("value", []))
+                url = page.get("@odata.nextLink")
+                params = None
             logger.info(f"Retrieved {len(events)} calendar events")
             
             return events
@@ -130,8 +170,8 @@ class OutlookCalendar:
                 end_str = event.get("end", {}).get("dateTime")
                 
                 if start_str and end_str:
-                    start_dt = datetime.fromisoformat(start_str.replace("Z", "+00:00"))
-                    end_dt = datetime.fromisoformat(end_str.replace("Z", "+00:00"))
+                    start_dt = parse_graph_datetime(start_str)
+                    end_dt = parse_graph_datetime(end_str)
                     
                     busy_times.append({
                         "start": start_dt,
@@ -165,13 +205,14 @@ class OutlookCalendar:
         end_check = target_time + timedelta(minutes=duration_minutes + buffer_minutes)
         
         busy_times = self.get_busy_times(start_check, end_check)
+        target_end = target_time + timedelta(minutes=duration_minutes)
         
         for busy in busy_times:
             busy_start = busy["start"]
             busy_end = busy["end"]
             
             # Check for overlap
-            if (target_time < busy_end) and (target_time + timedelta(minutes=duration_minutes) > busy_start):
+            if (target_time < busy_end) and (target_end > busy_start):
                 logger.info(
                     f"Time conflict detected: {target_time} conflicts with "
                     f"{busy['subject']} ({busy_start} - {busy_end})"
@@ -196,10 +237,34 @@ class OutlookCalendar:
         Returns:
             List of available times (no calendar conflicts)
         """
+        if not candidate_times:
+            return []
+        
+        # One calendar query spanning every candidate instead of one per candidate
+        duration = timedelta(minutes=duration_minutes)
+        window_start = min(candidate_times) - timedelta(minutes=buffer_minutes)
+        window_end = max(candidate_times) + timedelta(minutes=duration_minutes + buffer_minutes)
+        busy_times = sorted(self.get_busy_times(window_start, window_end), key=lambda busy: busy["start"])
+        
+        # latest[i] is whichever of the first i+1 events (by start) ends last; a
+        # candidate conflicts iff, among events starting before it ends, that one
+        # ends after it starts
+        starts = [busy["start"] for busy in busy_times]
+        latest = []
+        for busy in busy_times:
+            latest.append(busy if not latest or busy["end"] > latest[-1]["end"] else latest[-1])
+        
         available = []
-        for time in candidate_times:
-            if self.is_time_available(time, duration_minutes, buffer_minutes):
-                available.append(time)
+        for candidate in candidate_times:
+            count = bisect_left(starts, candidate + duration)
+            if count and latest[count - 1]["end"] > candidate:
+                busy = latest[count - 1]
+                logger.info(
+                    f"Time conflict detected: {candidate} conflicts with "
+                    f"{busy['subject']} ({busy['start']} - {busy['end']})"
+                )
+                continue
+            available.append(candidate)
         
         return available
 
@@ -1,14 +1,34 @@
 """Configuration loader for the tennis booking bot."""
 import os
+import sys
+from functools import lru_cache
 import yaml
 from pathlib import Path
 from dotenv import load_dotenv
-from typing import Dict, List, Any
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping
 from datetime import datetime
 
 # Load environment variables
 load_dotenv()
 
+# Use the libyaml C loader when PyYAML was built with it (optional)
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+
+@lru_cache(maxsize=8)
+def _load_yaml(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a YAML file; cached per (path, mtime) so an edited file is re-read.
+    
+    The returned dict is shared by every Config built from the same file,
+    so treat it as read-only.
+    """
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=YamlLoader)
+
 
 class Config:
     """Configuration manager for the booking bot."""
@@ -26,8 +46,27 @@ class Config:
     
     def _load_config(self):
         """Load configuration from YAML file."""
-        with open(self.config_path, 'r') as f:
-            self._config = yaml.safe_load(f)
+        self._config = _load_yaml(str(self.config_path), self.config_path.stat().st_mtime_ns)
+        
+        # Selectors are looked up in every scan loop: validate and intern them once,
+        # read-only so the shared YAML dict can't be changed through them
+        selectors = {}
+        for name, selector in self._config['selectors'].items():
+            if not isinstance(selector, str) or not selector.strip():
+                raise ValueError(f"Selector '{name}' in {self.config_path} must be a non-empty string")
+            selectors[sys.intern(name)] = sys.intern(selector)
+        self._selectors = MappingProxyType(selectors)
+        
+        # Test mode values are read in scheduler loops, so resolve them once. The
+        # date is only parsed when first used in test mode, so a stale test date
+        # can't stop a normal run from starting.
+        test_mode = self._config.get('test_mode') or {}
+        self._test_mode_enabled = test_mode.get('enabled', False)
+        self._test_target_date_str = test_mode.get('target_date')
+        self._test_target_date = None
+        self._test_target_court = test_mode.get('target_court')
+        time_str = test_mode.get('target_time')
+        self._test_target_time = [time_str] if time_str else None
     
     def _load_env(self):
         """Load configuration from environment variables."""
@@ -68,9 +107,15 @@ class Config:
         return self._config['urls']
     
     @property
-    def selectors(self) -> Dict[str, str]:
-        """Get CSS selector configuration."""
-        return self._config['selectors']
+    def program_registrations_url(self) -> str:
+        """Get URL of the Program Registrations (my bookings) page."""
+        urls = self._config['urls']
+        return urls.get('program_registrations') or f"{urls['base']}/Profile/ProgramRegistrations"
+    
+    @property
+    def selectors(self) -> Mapping[str, str]:
+        """Get CSS selector configuration (read-only)."""
+        return self._selectors
     
     @property
     def booking(self) -> Dict[str, Any]:
@@ -82,37 +127,48 @@ class Config:
         """Get scheduler configuration."""
         return self._config['scheduler']
     
+    @property
+    def manual(self) -> Dict[str, Any]:
+        """Get manual mode configuration (empty if the section is missing)."""
+        return self._config.get('manual') or {}
+    
+    @property
+    def debug_dump_html(self) -> bool:
+        """Check if page HTML should be saved to data/ for inspection."""
+        return self._config.get('debug', {}).get('dump_html', True)
+    
+    @property
+    def log_capture_max(self) -> int:
+        """Get how many log lines a booking run keeps for its notification."""
+        return self._config.get('debug', {}).get('log_capture_max') or 2000
+    
     @property
     def test_mode_enabled(self) -> bool:
         """Check if test mode is enabled."""
-        return self._config.get('test_mode', {}).get('enabled', False)
+        return self._test_mode_enabled
     
     @property
     def test_target_date(self) -> datetime:
         """Get target date for test mode (parsed from YYYY-MM-DD format)."""
-        if not self.test_mode_enabled:
+        if not self._test_mode_enabled or not self._test_target_date_str:
             return None
-        date_str = self._config.get('test_mode', {}).get('target_date')
-        if date_str:
-            return datetime.strptime(date_str, '%Y-%m-%d')
-        return None
+        if self._test_target_date is None:
+            self._test_target_date = datetime.strptime(self._test_target_date_str, '%Y-%m-%d')
+        return self._test_target_date
     
     @property
     def test_target_court(self) -> str:
         """Get target court name for test mode."""
-        if not self.test_mode_enabled:
+        if not self._test_mode_enabled:
             return None
-        return self._config.get('test_mode', {}).get('target_court')
+        return self._test_target_court
     
     @property
     def test_target_time(self) -> List[str]:
         """Get target time for test mode as a list (e.g., ["11:00"])."""
-        if not self.test_mode_enabled:
+        if not self._test_mode_enabled:
             return None
-        time_str = self._config.get('test_mode', {}).get('target_time')
-        if time_str:
-            return [time_str]
-        return None
+        return self._test_target_time
     
     def get_browser_state_path(self) -> Path:
         """Get path to browser state directory."""
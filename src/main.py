@@ -1,149 +1,386 @@
 """Main entry point for the tennis booking bot."""
 import argparse
+import collections
+import hashlib
+import json
 import logging
+import os
+import queue
+import re
 import sys
-from logging.handlers import RotatingFileHandler
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from playwright.sync_api import sync_playwright
+from typing import Callable
+from playwright.sync_api import BrowserContext, Page, Route, sync_playwright
 from .config_loader import Config
 from .auth import AuthHandler
 from .booking_engine import BookingEngine
 from .scheduler import BookingScheduler
 from .manual_mode import run_manual_mode
-from .notifications import NotificationSender
+from .notifications import get_notification_sender
+
+# Log records between rotation size checks in BatchedRotatingFileHandler (power of two)
+ROLLOVER_CHECK_EVERY = 64
+
+# Write buffer for the log file; flushed whenever the log queue runs empty
+LOG_FILE_BUFFER_BYTES = 64 * 1024
+
+
+class BatchedRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that batches its size checks and writes.
+    
+    The stock handler stats the log file and flushes it on every record; a
+    burst of booking debug lines doesn't need that. The size is checked every
+    ROLLOVER_CHECK_EVERY records (so the file may overshoot maxBytes by that
+    many records), and writes collect in a 64KB buffer until flush_now() -
+    called by FlushingQueueListener once it has drained the queue.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._records_since_check = 0
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=LOG_FILE_BUFFER_BYTES,
+                    encoding=self.encoding, errors=self.errors)
+    
+    def shouldRollover(self, record):
+        self._records_since_check = (self._records_since_check + 1) & (ROLLOVER_CHECK_EVERY - 1)
+        if self._records_since_check:
+            return False
+        return super().shouldRollover(record)
+    
+    def flush(self):
+        # Called after every record by StreamHandler.emit; deferred to flush_now()
+        pass
+    
+    def flush_now(self):
+        """Write out buffered records."""
+        super().flush()
+
+
+class FlushingQueueListener(QueueListener):
+    """QueueListener that flushes batched file handlers whenever the queue runs empty."""
+    
+    def handle(self, record):
+        super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                if isinstance(handler, BatchedRotatingFileHandler):
+                    handler.flush_now()
+
 
 # Set up logging
-def setup_logging(config: Config):
-    """Set up logging configuration."""
+def setup_logging(config: Config) -> QueueListener:
+    """Set up logging configuration.
+    
+    Log calls only enqueue records; a background QueueListener does the file and
+    stdout writes, so the booking path never blocks on I/O. Returns the started
+    listener, which must be stopped on exit to flush the queue.
+    """
     log_file = Path(config.log_file)
     log_file.parent.mkdir(parents=True, exist_ok=True)
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     
     # Create rotating file handler (max 10MB per file, keep 5 backup files)
-    file_handler = RotatingFileHandler(
+    file_handler = BatchedRotatingFileHandler(
         log_file,
         maxBytes=10*1024*1024,  # 10MB
         backupCount=5
     )
-    file_handler.setFormatter(
-        logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    )
+    file_handler.setFormatter(formatter)
     
-    logging.basicConfig(
-        level=getattr(logging, config.log_level),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            file_handler,
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(formatter)
+    
+    log_queue = queue.Queue(-1)
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, config.log_level))
+    root.handlers = [QueueHandler(log_queue)]
+    
+    listener = FlushingQueueListener(log_queue, file_handler, stream_handler, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+# Banner separator and timestamp format for the booking run log blocks
+SEP = "=" * 80
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
 
+# Static asset URLs served from the local asset cache (query strings allowed)
+STATIC_ASSET_PATTERN = re.compile(r'\.(?:css|js|woff2?|png|webp|gif)(?:\?|$)', re.IGNORECASE)
 
-def run_booking(config: Config, headless: bool = False) -> bool:
-    """Run a single booking attempt."""
+# Response headers stored with a cached asset and replayed with it (the body is
+# stored decoded, so content-encoding/length are left for Playwright to set)
+CACHED_ASSET_HEADERS = ('content-type', 'cache-control', 'etag', 'last-modified', 'expires')
+
+
+def install_asset_cache(context: BrowserContext, config: Config):
+    """Serve the booking site's static assets from data/asset_cache when fresh.
+    
+    Cached files older than booking.asset_cache_hours are fetched again so a
+    site update is picked up; 0 disables the cache. Only 200 responses are
+    stored, and an asset that fails to fetch is left to the browser.
+    """
+    max_age_hours = config.booking.get('asset_cache_hours', 24)
+    if not max_age_hours:
+        return
+    max_age = max_age_hours * 3600
+    cache_dir = config.browser_state_path.parent / "asset_cache"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    logger = logging.getLogger(__name__)
+    
+    # Drop expired entries: a site deploy with new hashed asset URLs would
+    # otherwise leave the old ones behind for good
+    expired_before = time.time() - max_age
+    removed = 0
+    for entry in cache_dir.iterdir():
+        try:
+            if entry.is_file() and entry.stat().st_mtime < expired_before:
+                entry.unlink()
+                removed += 1
+        except OSError as e:
+            logger.debug(f"Could not remove expired asset cache entry {entry}: {e}")
+    if removed:
+        logger.debug(f"Removed {removed} expired asset cache file(s)")
+    
+    def handle(route: Route):
+        request = route.request
+        if request.method != 'GET':
+            route.fallback()
+            return
+        
+        key = hashlib.blake2b(request.url.encode('utf-8'), digest_size=16).hexdigest()
+        body_file = cache_dir / key
+        headers_file = cache_dir / f"{key}.json"
+        try:
+            if headers_file.exists() and time.time() - headers_file.stat().st_mtime < max_age:
+                cached = json.loads(headers_file.read_text())
+                route.fulfill(status=cached['status'], headers=cached['headers'], body=body_file.read_bytes())
+                return
+        except Exception as e:
+            logger.debug(f"Asset cache read failed for {request.url}: {e}")
+        
+        try:
+            response = route.fetch()
+        except Exception as e:
+            # Let the browser load it itself rather than leave the request hanging
+            logger.debug(f"Asset fetch failed for {request.url}: {e}")
+            route.fallback()
+            return
+        
+        if response.status == 200:
+            try:
+                headers = {name: response.headers[name] for name in CACHED_ASSET_HEADERS if name in response.headers}
+                body_file.write_bytes(response.body())
+                headers_file.write_text(json.dumps({'status': response.status, 'headers': headers}))
+            except Exception as e:
+                logger.debug(f"Asset cache write failed for {request.url}: {e}")
+        route.fulfill(response=response)
+    
+    context.route(STATIC_ASSET_PATTERN, handle)
+
+
+def boost_priority() -> Callable[[], None]:
+    """Raise scheduling priority and pin to one CPU for the booking clicks (Linux only).
+    
+    Enabled by booking.priority_boost. Lowering niceness needs CAP_SYS_NICE (or
+    root); without it only the CPU pinning applies. Running under a systemd unit
+    with CPUSchedulingPolicy=fifo gives further gains. Returns a function that
+    restores the previous niceness and affinity.
+    """
+    logger = logging.getLogger(__name__)
+    if sys.platform != 'linux':
+        return lambda: None
+    
+    reniced = False
+    old_affinity = None
+    try:
+        os.nice(-5)
+        reniced = True
+    except OSError as e:
+        logger.debug(f"Could not raise process priority: {e}")
+    try:
+        old_affinity = os.sched_getaffinity(0)
+        os.sched_setaffinity(0, {min(old_affinity)})
+    except OSError as e:
+        logger.debug(f"Could not pin process to a CPU: {e}")
+        old_affinity = None
+    
+    def restore():
+        try:
+            if reniced:
+                os.nice(5)
+            if old_affinity:
+                os.sched_setaffinity(0, old_affinity)
+        except OSError as e:
+            logger.debug(f"Could not restore process priority: {e}")
+    
+    return restore
+
+
+def run_booking(
+    config: Config,
+    headless: bool = False,
+    context: BrowserContext = None,
+    page: Page = None,
+    notify_pool: ThreadPoolExecutor = None
+) -> bool:
+    """Run a single booking attempt.
+    
+    Pass an already-open persistent context to reuse it (the scheduler does);
+    only the attempt's page is closed afterwards. Without one, a browser is
+    launched on the saved browser state for this attempt and closed at the
+    end. A pre-warmed page from that context (already authenticated) skips
+    the auth step.
+    With notify_pool, the result notification is sent in the background
+    instead of holding up the caller.
+    """
     logger = logging.getLogger(__name__)
-    from datetime import datetime
-    from pathlib import Path
     
     # Set up notification sender
-    notification = NotificationSender()
+    notification = get_notification_sender()
     
-    # Capture log output
-    log_capture = []
+    # Capture log output (bounded so a chatty failed run can't grow it without limit)
+    log_capture = collections.deque(maxlen=config.log_capture_max)
     log_handler = None
     
-    # Set up log capture if email is configured
+    # Set up log capture if email is configured. Records are kept unformatted and
+    # only turned into text if the run fails - a successful booking email carries no log tail.
     if notification.email_from and notification.email_password:
         class LogCaptureHandler(logging.Handler):
             def __init__(self, capture_list):
                 super().__init__()
                 self.capture_list = capture_list
+                self.dropped = 0
             def emit(self, record):
-                self.capture_list.append(self.format(record))
+                if len(self.capture_list) == self.capture_list.maxlen:
+                    self.dropped += 1
+                self.capture_list.append(record)
+            def lines(self):
+                return [
+                    self.format(entry) if isinstance(entry, logging.LogRecord) else entry
+                    for entry in self.capture_list
+                ]
         
         log_handler = LogCaptureHandler(log_capture)
         log_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
         logger.addHandler(log_handler)
     
-    logger.info("=" * 80)
-    logger.info(f"Starting booking process at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    logger.info(f"Test mode: {'ENABLED' if config.test_mode_enabled else 'DISABLED'}")
+    banner = [
+        SEP,
+        f"Starting booking process at {datetime.now().strftime(TIMESTAMP_FORMAT)}",
+        f"Test mode: {'ENABLED' if config.test_mode_enabled else 'DISABLED'}",
+    ]
     if config.test_mode_enabled:
-        logger.info(f"  Test target: {config.test_target_court} on {config.test_target_date.strftime('%Y-%m-%d')} at {config.test_target_time}")
+        banner.append(f"  Test target: {config.test_target_court} on {config.test_target_date.strftime('%Y-%m-%d')} at {config.test_target_time}")
     else:
-        logger.info(f"  Target times: {config.booking_times}")
-        logger.info(f"  Booking window: {config.booking_window_days} days ahead")
-    logger.info("=" * 80)
+        banner.append(f"  Target times: {config.booking_times}")
+        banner.append(f"  Booking window: {config.booking_window_days} days ahead")
+    banner.append(SEP)
+    logger.info("\n".join(banner))
     
     booking_result = None
     booking_success = False
     error_message = None
     
     try:
-        with sync_playwright() as p:
-            # Launch browser
-            browser = p.chromium.launch(headless=headless)
+        with ExitStack() as stack:
+            # Set up authentication
+            auth_handler = AuthHandler(config)
+            if context is None:
+                # Launch a browser just for this attempt. The persistent profile is
+                # left to the scheduler, which may be holding its lock right now.
+                p = stack.enter_context(sync_playwright())
+                browser = p.chromium.launch(headless=headless)
+                stack.callback(browser.close)
+                context = auth_handler.create_browser_context(browser, headless)
+                install_asset_cache(context, config)
             
             try:
-                # Set up authentication
-                auth_handler = AuthHandler(config)
-                context = auth_handler.create_browser_context(browser, headless)
-                page = context.new_page()
-                
-                # Ensure authenticated
-                if not auth_handler.ensure_authenticated(page, context, headless):
-                    error_message = "Authentication failed - booking cannot proceed"
-                    logger.error(f"❌ {error_message}")
-                    logger.error("Please run 'python -m src.main --authenticate' to refresh authentication")
-                    return False
-                
-                logger.info("✅ Authentication successful")
-                
-                # Save browser state after authentication
-                auth_handler.save_browser_state(context)
+                if page is not None:
+                    logger.info("✅ Using pre-warmed page (authentication already checked)")
+                else:
+                    page = context.new_page()
+                    
+                    # Ensure authenticated
+                    if not auth_handler.ensure_authenticated(page, context, headless):
+                        error_message = "Authentication failed - booking cannot proceed"
+                        logger.error(f"❌ {error_message}")
+                        logger.error("Please run 'python -m src.main --authenticate' to refresh authentication")
+                        return False
+                    
+                    logger.info("✅ Authentication successful")
+                    
+                    # Save browser state after authentication
+                    auth_handler.save_browser_state(context)
                 
                 # Set up booking engine
                 booking_engine = BookingEngine(config)
                 
                 # Attempt booking
-                result = booking_engine.attempt_booking(
-                    page,
-                    config.booking_times,
-                    config.court_preference
-                )
+                restore_priority = boost_priority() if config.booking.get('priority_boost', False) else None
+                try:
+                    result = booking_engine.attempt_booking(
+                        page,
+                        config.booking_times,
+                        config.court_preference
+                    )
+                finally:
+                    if restore_priority:
+                        restore_priority()
                 
-                logger.info("=" * 80)
+                finished_at = datetime.now().strftime(TIMESTAMP_FORMAT)
                 if result:
                     booking_success = True
                     booking_result = result
-                    logger.info(f"✅ BOOKING SUCCESSFUL")
-                    logger.info(f"   Court: {result.get('court_name', 'Unknown')}")
-                    logger.info(f"   Date: {result.get('date', 'Unknown')}")
-                    logger.info(f"   Time: {result.get('time', 'Unknown')}")
-                    logger.info(f"   Completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+                    logger.info("\n".join([
+                        SEP,
+                        "✅ BOOKING SUCCESSFUL",
+                        f"   Court: {result.get('court_name', 'Unknown')}",
+                        f"   Date: {result.get('date', 'Unknown')}",
+                        f"   Time: {result.get('time', 'Unknown')}",
+                        f"   Completed at: {finished_at}",
+                        SEP,
+                    ]))
                 else:
-                    logger.warning("⚠️  No booking was made")
-                    logger.warning("   Possible reasons:")
-                    logger.warning("   - No slots available at target times")
-                    logger.warning("   - All slots were already booked")
-                    logger.warning("   - Booking process encountered an error")
-                    logger.info(f"   Completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-                logger.info("=" * 80)
+                    if booking_engine.last_court_error:
+                        error_message = f"Error checking courts (last: {booking_engine.last_court_error})"
+                    logger.warning("\n".join([
+                        SEP,
+                        "⚠️  No booking was made",
+                        "   Possible reasons:",
+                        "   - No slots available at target times",
+                        "   - All slots were already booked",
+                        "   - Booking process encountered an error",
+                        f"   Completed at: {finished_at}",
+                        SEP,
+                    ]))
                     
             except Exception as e:
                 error_message = f"Error in booking process: {str(e)}"
-                logger.error("=" * 80)
-                logger.error(f"❌ {error_message}")
-                logger.error(f"   Error occurred at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-                logger.error("=" * 80)
-                import traceback
-                logger.error(traceback.format_exc())
-                log_capture.append(traceback.format_exc())
+                logger.error("\n".join([
+                    SEP,
+                    f"❌ {error_message}",
+                    f"   Error occurred at: {datetime.now().strftime(TIMESTAMP_FORMAT)}",
+                    SEP,
+                ]))
+                tb_str = traceback.format_exc()
+                logger.error(tb_str)
+                if log_handler is None:
+                    # Not captured via the handler; keep it for the notification
+                    log_capture.append(tb_str)
             finally:
-                browser.close()
+                if page is not None:
+                    page.close()
     except Exception as e:
         error_message = f"Critical error: {str(e)}"
         logger.error(f"❌ {error_message}")
-        import traceback
         log_capture.append(traceback.format_exc())
     
     # Remove log capture handler
@@ -151,15 +388,30 @@ def run_booking(config: Config, headless: bool = False) -> bool:
         logger.removeHandler(log_handler)
     
     # Send notification
-    try:
-        notification.send_booking_notification(
-            success=booking_success,
-            booking_details=booking_result,
-            log_lines=log_capture if log_capture else None,
-            error_message=error_message
-        )
-    except Exception as e:
-        logger.warning(f"Failed to send notification: {e}")
+    log_lines = None
+    if not booking_success:
+        log_lines = log_handler.lines() if log_handler else list(log_capture)
+        if log_handler and log_handler.dropped:
+            log_lines.insert(0, f"(truncated, {log_handler.dropped} older lines dropped)")
+    
+    def send_notification():
+        try:
+            notification.send_booking_notification(
+                success=booking_success,
+                booking_details=booking_result,
+                log_lines=log_lines if log_lines else None,
+                error_message=error_message
+            )
+        except Exception as e:
+            logger.warning(f"Failed to send notification: {e}")
+        finally:
+            # The sender is shared; its connections would go stale before the next booking
+            notification.close()
+    
+    if notify_pool is not None:
+        notify_pool.submit(send_notification)
+    else:
+        send_notification()
     
     return booking_success
 
@@ -169,17 +421,70 @@ def run_scheduled(config: Config, headless: bool = False):
     logger = logging.getLogger(__name__)
     logger.info("Starting scheduled booking bot...")
     
-    def booking_task():
-        """Task to run for each scheduled booking."""
-        return run_booking(config, headless)
-    
-    scheduler = BookingScheduler(config, booking_task)
-    scheduler.print_schedule()
+    auth_handler = AuthHandler(config)
+    # Notifications go out in the background so an SMTP stall never delays the next booking
+    notify_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='notify')
     
-    try:
-        scheduler.run_continuously()
-    except KeyboardInterrupt:
-        logger.info("Scheduler stopped by user")
+    with sync_playwright() as p:
+        # One persistent profile for the whole session: each fire skips Chromium
+        # start-up and reuses the warm HTTP cache and cookies
+        session = {'context': None}
+        
+        def open_context() -> BrowserContext:
+            context = auth_handler.open_persistent_context(p, headless)
+            context.on('close', lambda _: session.update(context=None))
+            install_asset_cache(context, config)
+            session['context'] = context
+            return context
+        
+        open_context()
+        
+        def current_context() -> BrowserContext:
+            if session['context'] is None:
+                logger.warning("Browser profile was closed - reopening")
+                return open_context()
+            return session['context']
+        
+        def prewarm_task():
+            """Open and authenticate the booking page ahead of the scheduled time."""
+            # Drop a pre-warmed page the last booking never consumed
+            stale = session.pop('page', None)
+            if stale is not None and not stale.is_closed():
+                stale.close()
+            
+            context = current_context()
+            auth_handler.refresh_saved_cookies(context)
+            page = context.new_page()
+            if auth_handler.ensure_authenticated(page, context, headless):
+                auth_handler.save_browser_state(context)
+                session['page'] = page
+            else:
+                # Leave it to the booking run to report the auth failure
+                logger.warning("Pre-warm authentication check failed")
+                page.close()
+        
+        def booking_task():
+            """Task to run for each scheduled booking."""
+            context = current_context()
+            page = session.pop('page', None)
+            if page is not None and page.is_closed():
+                page = None
+            if page is None:
+                auth_handler.refresh_saved_cookies(context)
+            return run_booking(config, headless, context=context, page=page, notify_pool=notify_pool)
+        
+        scheduler = BookingScheduler(config, booking_task, prewarm_task)
+        scheduler.print_schedule()
+        
+        try:
+            scheduler.run_continuously()
+        except KeyboardInterrupt:
+            logger.info("Scheduler stopped by user")
+        finally:
+            if session['context'] is not None:
+                session['context'].close()
+            # Let pending notifications finish before exiting
+            notify_pool.shutdown(wait=True)
 
 
 def authenticate_only(config: Config):
@@ -188,24 +493,17 @@ def authenticate_only(config: Config):
     logger.info("Running authentication setup...")
     
     with sync_playwright() as p:
+        auth_handler = AuthHandler(config)
+        # Not the persistent profile: a running scheduler holds its lock. The
+        # state file saved here is picked up by the scheduler before its next booking.
         browser = p.chromium.launch(headless=False)
         
         try:
-            auth_handler = AuthHandler(config)
             context = auth_handler.create_browser_context(browser, headless=False)
             page = context.new_page()
             
-            # Navigate to booking page
-            page.goto(config.booking_url, wait_until='networkidle')
-            
-            # Handle cookie consent
-            try:
-                cookie_button = page.query_selector(config.selectors['cookie_button'])
-                if cookie_button and cookie_button.is_visible():
-                    cookie_button.click()
-                    page.wait_for_timeout(1000)
-            except Exception:
-                pass
+            # Navigate to booking page (ensure_authenticated waits for what it needs)
+            page.goto(config.booking_url, wait_until='domcontentloaded')
             
             # Authenticate
             if auth_handler.ensure_authenticated(page, context, headless=False):
@@ -259,28 +557,46 @@ def main():
     # Load configuration
     config = Config(args.config)
     
-    # Set up logging
-    setup_logging(config)
+    # Set up logging. --authenticate is a short interactive run, so it only logs
+    # to stdout and skips the log file and background listener.
+    if args.authenticate:
+        logging.basicConfig(
+            level=getattr(logging, config.log_level),
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            stream=sys.stdout
+        )
+        log_listener = None
+    else:
+        log_listener = setup_logging(config)
     
     logger = logging.getLogger(__name__)
     logger.info("Tennis Booking Bot starting...")
     
-    # Determine mode
-    if args.authenticate:
-        authenticate_only(config)
-    elif args.manual:
-        run_manual_mode(config)
-    elif args.test_now:
-        # Test mode: run booking immediately (same as auto mode but bypasses scheduler)
-        logger.info("Running test mode - booking attempt will start immediately")
-        success = run_booking(config, headless=args.headless)
-        sys.exit(0 if success else 1)
-    elif args.schedule:
-        run_scheduled(config, headless=args.headless)
-    else:
+    def run_once():
         # Single booking run (auto mode - one attempt)
         success = run_booking(config, headless=args.headless)
         sys.exit(0 if success else 1)
+    
+    def run_test_now():
+        # Test mode: run booking immediately (same as auto mode but bypasses scheduler)
+        logger.info("Running test mode - booking attempt will start immediately")
+        run_once()
+    
+    # Mode flags in precedence order; the first one set wins
+    modes = {
+        'authenticate': lambda: authenticate_only(config),
+        'manual': lambda: run_manual_mode(config),
+        'test_now': run_test_now,
+        'schedule': lambda: run_scheduled(config, headless=args.headless),
+    }
+    mode = next((name for name in modes if getattr(args, name)), None)
+    
+    try:
+        modes.get(mode, run_once)()
+    finally:
+        # Flush queued log records before the process exits
+        if log_listener is not None:
+            log_listener.stop()
 
 
 if __name__ == '__main__':
@@ -1,9 +1,13 @@
 """Interactive manual mode for testing and manual booking."""
+import io
 import logging
+import queue
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
-from playwright.sync_api import sync_playwright
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from playwright.sync_api import BrowserContext, Page, Route, sync_playwright, TimeoutError as PlaywrightTimeoutError
 from .config_loader import Config
 from .auth import AuthHandler
 from .booking_engine import BookingEngine
@@ -11,6 +15,46 @@ from .bookings_manager import BookingsManager
 
 logger = logging.getLogger(__name__)
 
+# Chromium flags that switch off subsystems manual mode never uses (manual.perf_launch_args)
+PERF_LAUNCH_ARGS = [
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-features=TranslateUI",
+]
+
+# Selector probes for _test_selectors, read in one round-trip
+SELECTOR_PROBE_JS = """sel => {
+    const courts = [...document.querySelectorAll(sel.court)];
+    return {
+        hasCookie: !!document.querySelector(sel.cookie),
+        courtCount: courts.length,
+        courts: courts.slice(0, 5).map(link => (link.innerText || '').split('\\n')[0]),
+    };
+}"""
+
+# How long the court list from the program page is reused within a session
+COURTS_CACHE_SECONDS = 300
+
+# How long bookings listed by "View my bookings" are reused by "Cancel a booking"
+BOOKINGS_CACHE_SECONDS = 120
+
+# How long "View all open slots" skips a court that just showed no open slots
+EMPTY_COURT_SKIP_SECONDS = 60
+
+# Requests aborted in the headless scan workers when manual.block_resources is on. Stylesheets are kept: without
+# them hidden elements (e.g. the mobile date picker) count as visible.
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+ANALYTICS_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "hotjar.com",
+    "facebook.net",
+    "clarity.ms",
+)
+
 
 class ManualMode:
     """Interactive manual mode for testing and manual booking."""
@@ -25,30 +69,49 @@ class ManualMode:
         self.browser = None
         self._available_slots = []
         self._target_date = None
+        self._courts_cache = None  # (monotonic time, {court_name: court_link})
+        self._bookings_cache = None  # (monotonic time, bookings list)
+        self._empty_courts = {}  # {court_link: monotonic time it showed no open slots}
+        # Courts scanned at once by the availability views (1 = one by one on the main page)
+        self.scan_workers = config.manual.get('scan_workers', 4)
+        self.launch_args = PERF_LAUNCH_ARGS if config.manual.get('perf_launch_args', True) else []
+        self.block_resources = config.manual.get('block_resources', True)
+        # Saved browser state younger than this is trusted without a login check
+        self.auth_ttl_hours = config.manual.get('auth_ttl_hours', 6)
+        # Cookies as of the last browser state save, so state is only re-saved when they change
+        self._saved_cookies = None
     
     def start(self):
         """Start manual mode with browser."""
         logger.info("Starting manual mode...")
         
         playwright = sync_playwright().start()
-        self.browser = playwright.chromium.launch(headless=False)
+        self.browser = playwright.chromium.launch(headless=False, args=self.launch_args)
         
         try:
             # Set up authentication
             self.auth_handler = AuthHandler(self.config)
+            # No request routing on this headed context: sync Playwright only runs
+            # route handlers inside a Playwright call, so while the menu waits on
+            # input() every routed request from the window would hang
             self.context = self.auth_handler.create_browser_context(self.browser, headless=False)
             self.page = self.context.new_page()
             
-            # Ensure authenticated
-            if not self.auth_handler.ensure_authenticated(self.page, self.context, headless=False):
-                logger.error("Authentication failed")
-                print("\n⚠️  Authentication failed. The browser window is still open.")
-                print("Please check if you need to log in manually, then try again.")
-                print("You can also run: python src/main.py --authenticate")
-                return
-            
-            # Save browser state
-            self.auth_handler.save_browser_state(self.context)
+            if self._browser_state_is_fresh():
+                logger.info(f"Browser state is under {self.auth_ttl_hours}h old - skipping login check")
+                print("Using saved login (run with --authenticate if pages ask you to sign in).")
+            else:
+                # Ensure authenticated
+                if not self.auth_handler.ensure_authenticated(self.page, self.context, headless=False):
+                    logger.error("Authentication failed")
+                    print("\n⚠️  Authentication failed. The browser window is still open.")
+                    print("Please check if you need to log in manually, then try again.")
+                    print("You can also run: python src/main.py --authenticate")
+                    return
+                
+                # Save browser state
+                self.auth_handler.save_browser_state(self.context)
+            self._saved_cookies = self.context.cookies()
             
             # Set up booking engine
             self.booking_engine = BookingEngine(self.config)
@@ -67,6 +130,38 @@ class ManualMode:
             if self.browser:
                 self.browser.close()
     
+    def _install_resource_blocking(self, context: BrowserContext):
+        """Abort image/font/media and analytics requests the scans don't need.
+        
+        Only for the scan workers' headless contexts, which are always inside a
+        Playwright call while their pages load.
+        """
+        if not self.block_resources:
+            return
+        
+        def handle(route: Route):
+            request = route.request
+            if request.resource_type in BLOCKED_RESOURCE_TYPES or any(d in request.url for d in ANALYTICS_DOMAINS):
+                route.abort()
+            else:
+                route.continue_()
+        
+        context.route("**/*", handle)
+    
+    def _browser_state_is_fresh(self) -> bool:
+        """Check whether the saved browser state is recent enough to skip the login check."""
+        state_file = self.auth_handler.browser_state_file
+        if not self.auth_ttl_hours or not state_file.exists():
+            return False
+        return time.time() - state_file.stat().st_mtime < self.auth_ttl_hours * 3600
+    
+    def _save_state_if_changed(self):
+        """Save browser state only if cookies rotated since it was last saved."""
+        cookies = self.context.cookies()
+        if cookies != self._saved_cookies:
+            self.auth_handler.save_browser_state(self.context)
+            self._saved_cookies = cookies
+    
     def _interactive_loop(self):
         """Main interactive loop."""
         while True:
@@ -105,6 +200,109 @@ class ManualMode:
             else:
                 print("Invalid choice. Please enter 1-8.")
     
+    def _wait_for(self, page: Page, selector_name: str, timeout: int = 5000) -> bool:
+        """Wait for a configured selector to appear; False (not an error) if it doesn't."""
+        try:
+            page.wait_for_selector(self.config.selectors[selector_name], timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            logger.debug(f"Timed out waiting for {selector_name} on {page.url}")
+            return False
+    
+    def _wait_for_court_page(self, page: Page, timeout: int = 5000) -> bool:
+        """Wait until a court page shows its date buttons, or says it has no instances."""
+        ready = page.locator(self.config.selectors['date_button']).or_(
+            page.get_by_text("no instances available", exact=False)
+        )
+        try:
+            ready.first.wait_for(state='visible', timeout=timeout)
+            return True
+        except PlaywrightTimeoutError:
+            logger.debug(f"Timed out waiting for court page {page.url}")
+            return False
+    
+    def _get_courts(self) -> Dict[str, str]:
+        """Get the court list, reusing the last one for COURTS_CACHE_SECONDS.
+        
+        Only on a cache miss is the program page loaded; an empty result is not cached.
+        """
+        if self._courts_cache is not None:
+            fetched_at, courts = self._courts_cache
+            if time.monotonic() - fetched_at < COURTS_CACHE_SECONDS:
+                return courts
+        
+        self.page.goto(self.config.booking_url, wait_until='domcontentloaded', timeout=10000)
+        self._wait_for(self.page, 'court_link')
+        courts = self.booking_engine.get_available_courts(self.page)
+        self._courts_cache = (time.monotonic(), courts) if courts else None
+        return courts
+    
+    def _scan_courts(
+        self,
+        courts: Dict[str, str],
+        scan_court: Callable[[Page, str, str], Any]
+    ) -> Iterator[Tuple[str, Any]]:
+        """Run scan_court(page, court_name, court_link) for every court.
+        
+        Yields (court_name, result) as each court finishes; a court whose scan
+        raised yields the exception as its result. With scan_workers > 1 the
+        courts are spread over that many worker threads. Sync Playwright objects
+        can't be shared between threads, so each worker runs its own headless
+        browser loaded from the saved browser state. Otherwise they run one by
+        one on the interactive page.
+        """
+        workers = min(self.scan_workers, len(courts))
+        if workers <= 1:
+            for court_name, court_link in courts.items():
+                try:
+                    yield court_name, scan_court(self.page, court_name, court_link)
+                except Exception as e:
+                    yield court_name, e
+            return
+        
+        # Browser state is re-read by each worker context
+        self._save_state_if_changed()
+        pending = queue.SimpleQueue()
+        for item in courts.items():
+            pending.put(item)
+        results = queue.SimpleQueue()
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='court-scan') as pool:
+            for _ in range(workers):
+                pool.submit(self._scan_worker, pending, results, scan_court)
+            for _ in range(len(courts)):
+                yield results.get()
+    
+    def _scan_worker(self, pending: queue.SimpleQueue, results: queue.SimpleQueue, scan_court: Callable):
+        """Scan courts from pending on this thread's own browser until none are left."""
+        try:
+            with sync_playwright() as playwright:
+                browser = playwright.chromium.launch(headless=True, args=self.launch_args)
+                try:
+                    context = self.auth_handler.create_browser_context(browser, headless=True)
+                    self._install_resource_blocking(context)
+                    page = context.new_page()
+                    while True:
+                        try:
+                            court_name, court_link = pending.get_nowait()
+                        except queue.Empty:
+                            return
+                        try:
+                            results.put((court_name, scan_court(page, court_name, court_link)))
+                        except Exception as e:
+                            results.put((court_name, e))
+                finally:
+                    browser.close()
+        except Exception as e:
+            # Browser failed to start (or died): fail whatever is still queued
+            logger.warning(f"Court scan worker failed: {e}")
+            while True:
+                try:
+                    court_name, _ = pending.get_nowait()
+                except queue.Empty:
+                    break
+                results.put((court_name, e))
+    
     def _check_availability(self):
         """Check and display available slots for 7 days from today (exactly 7 days ahead)."""
         booking_window = self.config.booking_window_days
@@ -118,21 +316,8 @@ class ManualMode:
         print("="*80)
         
         try:
-            # Navigate to program page
-            self.page.goto(self.config.booking_url, wait_until='domcontentloaded', timeout=10000)
-            self.page.wait_for_timeout(1000)
-            
-            # Handle cookie consent
-            try:
-                cookie_button = self.page.query_selector(self.config.selectors['cookie_button'])
-                if cookie_button and cookie_button.is_visible(timeout=1000):
-                    cookie_button.click()
-                    self.page.wait_for_timeout(500)
-            except Exception:
-                pass
-            
             # Get available courts
-            courts = self.booking_engine.get_available_courts(self.page)
+            courts = self._get_courts()
             if not courts:
                 print("No courts found.")
                 return
@@ -141,47 +326,51 @@ class ManualMode:
             for i, (court_name, court_link) in enumerate(courts.items(), 1):
                 print(f"  {i}. {court_name}")
             
+            def scan_court(page: Page, court_name: str, court_link: str) -> Optional[List[Dict]]:
+                """Return the court's open slots on the target date (None if the date isn't accessible)."""
+                # Navigate to court page
+                page.goto(court_link, wait_until='domcontentloaded', timeout=10000)
+                self._wait_for_court_page(page)
+                
+                # Navigate to target date (7 days from today)
+                if not self.booking_engine.navigate_to_target_date_fast(page, target_date):
+                    return None
+                
+                # Find all available slots for this date
+                return self.booking_engine.find_all_available_slots_for_date(page, target_date, navigate=False)
+            
             # Check each court for the target date (7 days from today)
-            all_slots = {}
+            print(f"\nChecking {date_display} on {len(courts)} court(s)...")
+            found = {}
+            
+            for court_name, date_slots in self._scan_courts(courts, scan_court):
+                if isinstance(date_slots, Exception):
+                    logger.warning(f"Error processing court {court_name}: {date_slots}")
+                    print(f"  {court_name}: Error: {date_slots}")
+                elif date_slots is None:
+                    print(f"  {court_name}: ❌ (date not accessible)")
+                else:
+                    print(f"  {court_name}: ✓ {len(date_slots)} slot(s)")
+                    if date_slots:
+                        found[court_name] = date_slots
             
+            # Keep the results in court-list order. Each slot dict is completed once
+            # here and shared as-is with _book_slot_manual.
+            date_str = target_date.strftime('%Y-%m-%d')
+            all_slots = {}
             for court_name, court_link in courts.items():
-                print(f"\n{'='*80}")
-                print(f"Checking {court_name}...")
-                print("="*80)
-                
-                try:
-                    # Navigate to court page
-                    self.page.goto(court_link, wait_until='domcontentloaded', timeout=10000)
-                    self.page.wait_for_timeout(1000)
-                    
-                    print(f"  Checking {date_display}...", end=' ', flush=True)
-                    
-                    # Navigate to target date (7 days from today)
-                    if not self.booking_engine.navigate_to_target_date_fast(self.page, target_date):
-                        print("❌ (date not accessible)")
-                        continue
-                    
-                    # Find all available slots for this date
-                    date_slots = self.booking_engine.find_all_available_slots_for_date(self.page, target_date)
-                    
-                    if date_slots:
-                        for slot in date_slots:
-                            slot['court_link'] = court_link
-                            slot['date'] = target_date.strftime('%Y-%m-%d')
-                            slot['date_display'] = date_display
-                        
-                        all_slots[court_name] = {
-                            'court_link': court_link,
-                            'slots': date_slots
-                        }
-                        print(f"✓ {len(date_slots)} slot(s)")
-                    else:
-                        print("✓ 0 slots")
-                            
-                except Exception as e:
-                    logger.warning(f"Error processing court {court_name}: {e}")
-                    print(f"  Error: {e}")
+                if court_name not in found:
                     continue
+                date_slots = found[court_name]
+                for slot in date_slots:
+                    slot['court_link'] = court_link
+                    slot['date'] = date_str
+                    slot['date_display'] = date_display
+                    slot['label'] = f"{slot['time']} at {slot['court_name']} ({slot['spots_text']})"
+                all_slots[court_name] = {
+                    'court_link': court_link,
+                    'slots': date_slots
+                }
             
             # Display results
             print("\n" + "="*80)
@@ -198,16 +387,13 @@ class ManualMode:
             for court_name, court_data in all_slots.items():
                 print(f"\n{court_name}:")
                 for slot in court_data['slots']:
-                    print(f"  [{slot_number}] {slot['time']} - {slot['court_name']} ({slot['spots']})")
-                    slot_list.append({
-                        'court_name': court_name,
-                        'court_link': court_data['court_link'],
-                        **slot
-                    })
+                    print(f"  [{slot_number}] {slot['label']}")
+                    slot_list.append(slot)
                     slot_number += 1
             
             # Store slots for potential booking
             self._available_slots = slot_list
+            self._target_date = target_date
             
         except Exception as e:
             logger.error(f"Error checking availability: {e}", exc_info=True)
@@ -221,7 +407,7 @@ class ManualMode:
         
         print("\nAvailable slots:")
         for i, slot in enumerate(self._available_slots, 1):
-            print(f"  {i}. {slot['time']} at {slot['court_name']} ({slot['spots']})")
+            print(f"  {i}. {slot['label']}")
         
         try:
             choice = input("\nEnter slot number to book (or 'cancel'): ").strip()
@@ -242,9 +428,10 @@ class ManualMode:
                 print("Booking cancelled.")
                 return
             
-            # Navigate to court page
-            self.page.goto(selected_slot['court_link'], wait_until='networkidle')
-            self.page.wait_for_timeout(2000)
+            # Navigate to court page (a one-by-one scan may have left us on it already)
+            if self.page.url.rstrip('/') != selected_slot['court_link'].rstrip('/'):
+                self.page.goto(selected_slot['court_link'], wait_until='domcontentloaded')
+                self._wait_for_court_page(self.page)
             
             # Navigate to target date
             if not self.booking_engine.navigate_to_target_date(self.page, self._target_date):
@@ -262,6 +449,7 @@ class ManualMode:
                 print(f"✓ Successfully booked: {selected_slot['time']} at {selected_slot['court_name']}")
             else:
                 print("✗ Booking failed. Please try again.")
+            self._save_state_if_changed()
                 
         except ValueError:
             print("Invalid input. Please enter a number.")
@@ -278,25 +466,23 @@ class ManualMode:
             target_date = datetime.today() + timedelta(days=days_ahead)
             print(f"\nChecking availability for {target_date.strftime('%A, %B %d, %Y')}...")
             
-            # Navigate to program page
-            self.page.goto(self.config.booking_url, wait_until='networkidle')
-            self.page.wait_for_timeout(2000)
-            
             # Get courts
-            courts = self.booking_engine.get_available_courts(self.page)
+            courts = self._get_courts()
             if not courts:
                 print("No courts found.")
                 return
             
             # Check each court for the specific date
+            page = self.page
+            booking_engine = self.booking_engine
             for court_name, court_link in courts.items():
                 print(f"\n{court_name}:")
-                self.page.goto(court_link, wait_until='networkidle')
-                self.page.wait_for_timeout(2000)
+                page.goto(court_link, wait_until='domcontentloaded')
+                self._wait_for_court_page(page)
                 
-                if self.booking_engine.navigate_to_target_date(self.page, target_date):
+                if booking_engine.navigate_to_target_date(page, target_date):
                     # Find slots
-                    slots = self.booking_engine.find_available_slots(self.page, [])  # Empty list = all times
+                    slots = booking_engine.find_available_slots(page, [])  # Empty list = all times
                     if slots:
                         for slot in slots:
                             print(f"  - {slot['time']} ({slot['spots_text']})")
@@ -319,8 +505,8 @@ class ManualMode:
             current_url = self.page.url
             if '/profile/programregistrations' not in current_url.lower():
                 print("Navigating to bookings page...")
-                self.bookings_manager.view_bookings_page(self.page)
-                self.page.wait_for_timeout(2000)
+                # Returns once the booking cards have rendered
+                self.bookings_manager.view_bookings_page(self.page, return_html=False)
             else:
                 print("Already on bookings page.")
             
@@ -330,17 +516,18 @@ class ManualMode:
             # Get bookings
             print("\nParsing bookings...")
             bookings = self.bookings_manager.get_my_bookings(self.page)
+            self._bookings_cache = (time.monotonic(), bookings)
             
             if bookings:
                 print(f"\n✓ Found {len(bookings)} booking(s):")
                 print("="*80)
                 for i, booking in enumerate(bookings, 1):
                     date = booking.get('date', 'Unknown date')
-                    time = booking.get('time', 'Unknown time')
+                    time_text = booking.get('time', 'Unknown time')
                     court = booking.get('court', 'Unknown court')
                     location = booking.get('location', '')
                     
-                    print(f"\n  {i}. {date} at {time}")
+                    print(f"\n  {i}. {date} at {time_text}")
                     print(f"     Court: {court}")
                     if location:
                         print(f"     Location: {location}")
@@ -360,8 +547,15 @@ class ManualMode:
         print("="*80)
         
         try:
-            # First, get bookings
-            bookings = self.bookings_manager.get_my_bookings(self.page)
+            # First, get bookings (reusing a fresh "View my bookings" result while still on that page)
+            bookings = None
+            if self._bookings_cache is not None and '/profile/programregistrations' in self.page.url.lower():
+                listed_at, cached = self._bookings_cache
+                if time.monotonic() - listed_at < BOOKINGS_CACHE_SECONDS:
+                    bookings = cached
+            if bookings is None:
+                bookings = self.bookings_manager.get_my_bookings(self.page)
+                self._bookings_cache = (time.monotonic(), bookings)
             
             if not bookings:
                 print("No bookings found. Please view bookings first (option 4).")
@@ -399,9 +593,11 @@ class ManualMode:
                 
                 if confirm == 'yes':
                     if self.bookings_manager.cancel_booking(self.page, selected_booking):
+                        self._bookings_cache = None
                         print("✓ Booking cancelled successfully")
                     else:
                         print("✗ Failed to cancel booking")
+                    self._save_state_if_changed()
                 else:
                     print("Cancellation cancelled.")
                     
@@ -423,22 +619,9 @@ class ManualMode:
         print("="*80)
         
         try:
-            # Navigate to program page (faster load)
-            self.page.goto(self.config.booking_url, wait_until='domcontentloaded', timeout=10000)
-            self.page.wait_for_timeout(1000)
-            
-            # Handle cookie consent
-            try:
-                cookie_button = self.page.query_selector(self.config.selectors['cookie_button'])
-                if cookie_button and cookie_button.is_visible(timeout=1000):
-                    cookie_button.click()
-                    self.page.wait_for_timeout(500)
-            except Exception:
-                pass
-            
             # Get all courts
             print("\nFetching courts...")
-            courts = self.booking_engine.get_available_courts(self.page)
+            courts = self._get_courts()
             if not courts:
                 print("⚠️  No courts found")
                 return
@@ -446,72 +629,93 @@ class ManualMode:
             print(f"Found {len(courts)} court(s)")
             print("="*80)
             
-            all_availability = {}
+            # Key and display strings for every date in the window, formatted once for all courts
+            # (get_available_dates returns midnight datetimes from tomorrow through the window)
+            today = datetime.today().replace(hour=0, minute=0, second=0, microsecond=0)
+            date_labels = {}
+            for offset in range(1, booking_window + 1):
+                day = today + timedelta(days=offset)
+                date_labels[day] = (day.strftime('%Y-%m-%d'), day.strftime('%b %d, %Y (%a)'))
+            
+            def scan_court(page: Page, court_name: str, court_link: str) -> Optional[Dict[str, Dict]]:
+                """Return the court's open slots by date (None if no dates are bookable)."""
+                # Navigate to court page (faster load)
+                page.goto(court_link, wait_until='domcontentloaded', timeout=10000)
+                self._wait_for_court_page(page)
+                if page.get_by_text("no instances available", exact=False).first.is_visible():
+                    return None
+                
+                # Get available dates for this court (smart check - only dates with visible buttons)
+                available_dates = self.booking_engine.get_available_dates(page, booking_window)
+                if not available_dates:
+                    return None
+                
+                court_availability = {}
+                # Bound once for the date loop below
+                navigate_fast = self.booking_engine.navigate_to_target_date_fast
+                find_slots = self.booking_engine.find_all_available_slots_for_date
+                
+                # Check each available date
+                for date_obj in available_dates:
+                    labels = date_labels.get(date_obj)
+                    if labels is None:
+                        labels = (date_obj.strftime('%Y-%m-%d'), date_obj.strftime('%b %d, %Y (%a)'))
+                    date_str, date_display = labels
+                    try:
+                        # Navigate to this date (optimized fast navigation)
+                        if not navigate_fast(page, date_obj):
+                            logger.debug(f"Date {date_str} not accessible for {court_name}")
+                            continue
+                        
+                        # Find all available slots for this date
+                        available_slots = find_slots(page, date_obj, navigate=False)
+                        if available_slots:
+                            court_availability[date_str] = {
+                                'date_display': date_display,
+                                'slots': available_slots
+                            }
+                    except Exception as e:
+                        logger.debug(f"Error checking {court_name} for {date_str}: {e}")
+                        continue
+                
+                return court_availability
+            
+            found = {}
             total_slots = 0
+            court_idx = 0
+            
+            # Courts that had no open slots a moment ago aren't loaded again
+            now = time.monotonic()
+            to_scan = {}
+            for court_name, court_link in courts.items():
+                checked_at = self._empty_courts.get(court_link)
+                if checked_at is not None and now - checked_at < EMPTY_COURT_SKIP_SECONDS:
+                    court_idx += 1
+                    print(f"[{court_idx}/{len(courts)}] {court_name}: No open slots "
+                          f"(checked {int(now - checked_at)}s ago)")
+                else:
+                    to_scan[court_name] = court_link
             
             # Check each court
-            for court_idx, (court_name, court_link) in enumerate(courts.items(), 1):
-                print(f"\n[{court_idx}/{len(courts)}] Checking {court_name}...")
-                print("-" * 80)
-                
-                try:
-                    # Navigate to court page (faster load)
-                    self.page.goto(court_link, wait_until='domcontentloaded', timeout=10000)
-                    self.page.wait_for_timeout(1000)
-                    
-                    # Get available dates for this court (smart check - only dates with visible buttons)
-                    available_dates = self.booking_engine.get_available_dates(self.page, booking_window)
-                    
-                    if not available_dates:
-                        print(f"  ⚠️  No available dates found for {court_name}")
-                        continue
-                    
-                    print(f"  Found {len(available_dates)} available date(s) to check")
-                    
-                    court_availability = {}
-                    
-                    # Check each available date
-                    for date_obj in available_dates:
-                        date_str = date_obj.strftime('%Y-%m-%d')
-                        date_display = date_obj.strftime('%b %d, %Y (%a)')
-                        print(f"    Checking {date_display}...", end=' ', flush=True)
-                        
-                        try:
-                            # Navigate to this date (optimized fast navigation)
-                            if not self.booking_engine.navigate_to_target_date_fast(self.page, date_obj):
-                                print("❌ (date not accessible)")
-                                continue
-                            
-                            # Find all available slots for this date
-                            available_slots = self.booking_engine.find_all_available_slots_for_date(
-                                self.page, date_obj
-                            )
-                            
-                            if available_slots:
-                                court_availability[date_str] = {
-                                    'date_display': date_display,
-                                    'slots': available_slots
-                                }
-                                total_slots += len(available_slots)
-                                print(f"✓ {len(available_slots)} slot(s)")
-                            else:
-                                print("✓ 0 slots")
-                                
-                        except Exception as e:
-                            logger.debug(f"Error checking {court_name} for {date_str}: {e}")
-                            print(f"❌ Error: {e}")
-                            continue
-                    
-                    if court_availability:
-                        all_availability[court_name] = court_availability
-                        print(f"  Total: {sum(len(d['slots']) for d in court_availability.values())} slot(s) across {len(court_availability)} date(s)")
-                    else:
-                        print(f"  No available slots found for {court_name}")
-                            
-                except Exception as e:
-                    logger.warning(f"Error processing court {court_name}: {e}")
-                    print(f"  Error: {e}")
-                    continue
+            for court_idx, (court_name, court_availability) in enumerate(self._scan_courts(to_scan, scan_court), court_idx + 1):
+                prefix = f"[{court_idx}/{len(courts)}] {court_name}:"
+                if isinstance(court_availability, Exception):
+                    logger.warning(f"Error processing court {court_name}: {court_availability}")
+                    print(f"{prefix} Error: {court_availability}")
+                elif court_availability is None:
+                    self._empty_courts[to_scan[court_name]] = time.monotonic()
+                    print(f"{prefix} ⚠️  No available dates found")
+                elif not court_availability:
+                    self._empty_courts[to_scan[court_name]] = time.monotonic()
+                    print(f"{prefix} No available slots found")
+                else:
+                    court_total = sum(len(d['slots']) for d in court_availability.values())
+                    total_slots += court_total
+                    found[court_name] = court_availability
+                    print(f"{prefix} {court_total} slot(s) across {len(court_availability)} date(s)")
+            
+            # Keep the results in court-list order
+            all_availability = {name: found[name] for name in courts if name in found}
             
             # Display results
             print("\n" + "="*80)
@@ -522,34 +726,38 @@ class ManualMode:
                 print("\n⚠️  No available slots found for any court in the booking window.")
                 return
             
-            # Display by court
+            # Display by court. The report can run to hundreds of lines, so it is
+            # built in memory and written to the terminal in one go.
+            out = io.StringIO()
             for court_name, court_data in all_availability.items():
-                print(f"\n{'='*80}")
-                print(f"COURT: {court_name}")
-                print(f"{'='*80}")
+                print(f"\n{'='*80}", file=out)
+                print(f"COURT: {court_name}", file=out)
+                print(f"{'='*80}", file=out)
                 
                 # Sort dates
                 for date_str in sorted(court_data.keys()):
                     date_info = court_data[date_str]
                     slots = date_info['slots']
                     
-                    print(f"\n  📅 {date_info['date_display']}")
-                    print(f"     Available slots: {len(slots)}")
+                    print(f"\n  📅 {date_info['date_display']}", file=out)
+                    print(f"     Available slots: {len(slots)}", file=out)
                     
                     # Group slots by time for better readability
                     for slot in slots:
                         time_str = slot.get('time', 'Unknown')
                         spots_str = slot.get('spots_text', '')
-                        print(f"     • {time_str:15s} - {spots_str}")
+                        print(f"     • {time_str:15s} - {spots_str}", file=out)
             
             # Summary
-            print("\n" + "="*80)
-            print("SUMMARY")
-            print("="*80)
-            print(f"Total available slots: {total_slots}")
-            print(f"Courts with availability: {len(all_availability)}")
-            print(f"Days checked: {booking_window}")
-            print("="*80)
+            print("\n" + "="*80, file=out)
+            print("SUMMARY", file=out)
+            print("="*80, file=out)
+            print(f"Total available slots: {total_slots}", file=out)
+            print(f"Courts with availability: {len(all_availability)}", file=out)
+            print(f"Days checked: {booking_window}", file=out)
+            print("="*80, file=out)
+            sys.stdout.write(out.getvalue())
+            sys.stdout.flush()
             
         except Exception as e:
             logger.error(f"Error viewing all open slots: {e}", exc_info=True)
@@ -564,28 +772,27 @@ class ManualMode:
         
         try:
             # Navigate to program page
-            self.page.goto(self.config.booking_url, wait_until='networkidle')
-            self.page.wait_for_timeout(2000)
+            self.page.goto(self.config.booking_url, wait_until='domcontentloaded')
+            self._wait_for(self.page, 'court_link')
             
             print("\nTesting selectors...")
             print(f"Current URL: {self.page.url}")
             
-            # Test cookie button
-            cookie_btn = self.page.query_selector(self.config.selectors['cookie_button'])
-            print(f"Cookie button found: {cookie_btn is not None}")
+            probe = self.page.evaluate(SELECTOR_PROBE_JS, {
+                'cookie': self.config.selectors['cookie_button'],
+                'court': self.config.selectors['court_link'],
+            })
+            
+            # Test cookie button (usually already dismissed by the context init script)
+            print(f"Cookie button found: {probe['hasCookie']}")
             
             # Test court links
-            court_links = self.page.query_selector_all(self.config.selectors['court_link'])
-            print(f"Court links found: {len(court_links)}")
+            print(f"Court links found: {probe['courtCount']}")
             
-            if court_links:
+            if probe['courts']:
                 print("Courts:")
-                for i, link in enumerate(court_links[:5], 1):  # Show first 5
-                    try:
-                        text = link.inner_text().split('\n')[0]
-                        print(f"  {i}. {text}")
-                    except:
-                        print(f"  {i}. (could not read text)")
+                for i, text in enumerate(probe['courts'], 1):  # Show first 5
+                    print(f"  {i}. {text}")
             
             print("\nBrowser will stay open for inspection.")
             print("Press Enter when done...")
@@ -1,26 +1,147 @@
 """Notification system for booking and authentication status alerts."""
+import functools
 import logging
 import smtplib
+import string
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 from datetime import datetime
 from pathlib import Path
 import os
+import requests
 
 logger = logging.getLogger(__name__)
 
+# SMTP connection pool limits: most servers cap messages per connection and
+# drop idle sessions, so connections are retired before either happens
+SMTP_POOL_MAX = 5
+SMTP_MAX_MESSAGES_PER_CONNECTION = 100
+SMTP_CONNECTION_MAX_AGE_SECONDS = 100
+
+# SMTP server and port picked from the sender's email domain when SMTP_SERVER isn't set
+SMTP_SERVERS_BY_DOMAIN = {
+    'gmail.com': ('smtp.gmail.com', 587),
+    'outlook.com': ('smtp-mail.outlook.com', 587),
+    'hotmail.com': ('smtp-mail.outlook.com', 587),
+    'yahoo.com': ('smtp.mail.yahoo.com', 587),
+}
+
+# Email-to-SMS gateway domains by carrier (keys are lowercase)
+CARRIER_SMS_GATEWAYS = {
+    'att': '@txt.att.net',
+    'verizon': '@vtext.com',
+    'tmobile': '@tmomail.net',
+    'sprint': '@messaging.sprintpcs.com',
+    'uscellular': '@email.uscc.net',
+    'cricket': '@sms.cricketwireless.net',
+}
+SUPPORTED_CARRIERS = ', '.join(CARRIER_SMS_GATEWAYS)
+
+# SendGrid v3 send endpoint, posted to directly so the HTTPS connection is kept alive
+SENDGRID_SEND_URL = "https://api.sendgrid.com/v3/mail/send"
+
 # Try to import SendGrid (optional)
 try:
-    from sendgrid import SendGridAPIClient
     from sendgrid.helpers.mail import Mail
     SENDGRID_AVAILABLE = True
 except ImportError:
     SENDGRID_AVAILABLE = False
 
+# Notification email bodies, parsed once and filled in per notification
+BOOKING_SUCCESS_TEMPLATE = string.Template("""Tennis Booking Bot - Booking Result
+
+Status: ✅ SUCCESS
+Time: $timestamp
+
+Booking Details:
+  Court: $court_name
+  Date: $date
+  Time: $time
+
+The booking was completed successfully!
+""")
+
+BOOKING_FAILED_TEMPLATE = string.Template("""Tennis Booking Bot - Booking Result
+
+Status: ❌ FAILED
+Time: $timestamp
+
+The booking attempt did not succeed.
+
+$reason""")
+
+BOOKING_FAILED_REASONS = """Possible reasons:
+  - No slots available at target times
+  - All slots were already booked
+  - Booking process encountered an error
+
+"""
+
+AUTH_OK_TEMPLATE = string.Template("""Tennis Booking Bot - Authentication Status
+
+Status: ✅ WORKING
+Time: $timestamp
+
+Authentication is working correctly. The bot is ready to book courts.
+
+$details
+""")
+
+AUTH_FAILED_TEMPLATE = string.Template("""Tennis Booking Bot - Authentication Status
+
+Status: ❌ FAILED
+Time: $timestamp
+
+Authentication has failed. The bot cannot book courts.
+
+$details
+
+Action Required:
+1. Check the VM logs: bash scripts/monitoring/view_vm_logs.sh
+2. Re-authenticate: bash scripts/auth/reauth_vm.sh
+3. Check keep-alive service: bash scripts/auth/view_auth_keepalive_log.sh
+""")
+
+# Log lines included at the end of a booking email, and the rule framing them
+LOG_TAIL_LINES = 50
+LOG_RULE = "=" * 60
+
+
+class PooledSMTP:
+    """A logged-in SMTP connection held by the NotificationSender pool."""
+    
+    def __init__(self, server: smtplib.SMTP):
+        self.server = server
+        self.created_at = time.monotonic()
+        self.messages_sent = 0
+    
+    def expired(self) -> bool:
+        """Whether the connection is due to be retired instead of reused."""
+        return (self.messages_sent >= SMTP_MAX_MESSAGES_PER_CONNECTION
+                or time.monotonic() - self.created_at >= SMTP_CONNECTION_MAX_AGE_SECONDS)
+    
+    def quit(self):
+        """Log out and close, ignoring a connection the server already dropped."""
+        try:
+            self.server.quit()
+        except smtplib.SMTPException:
+            self.server.close()
+        except OSError:
+            pass
+
 
 class NotificationSender:
-    """Send notifications via email or SMS."""
+    """Send notifications via email or SMS.
+    
+    SMTP connections are pooled (up to SMTP_POOL_MAX, so an email and an SMS
+    can go out at the same time) and reused by later sends, e.g. the SMS that
+    follows a booking email. Call close() or use the sender as a context
+    manager when done.
+    """
     
     def __init__(self):
         """Initialize notification sender.
@@ -46,16 +167,46 @@ class NotificationSender:
         
         # Auto-detect SMTP settings based on email domain
         if self.email_from and not os.getenv('SMTP_SERVER'):
-            if '@gmail.com' in self.email_from:
-                self.smtp_server = 'smtp.gmail.com'
-                self.smtp_port = 587
-            elif '@outlook.com' in self.email_from or '@hotmail.com' in self.email_from:
-                self.smtp_server = 'smtp-mail.outlook.com'
-                self.smtp_port = 587
-            elif '@yahoo.com' in self.email_from:
-                self.smtp_server = 'smtp.mail.yahoo.com'
-                self.smtp_port = 587
+            domain = self.email_from.rpartition('@')[2].lower()
+            if domain in SMTP_SERVERS_BY_DOMAIN:
+                self.smtp_server, self.smtp_port = SMTP_SERVERS_BY_DOMAIN[domain]
+        
+        # Which notification channels can send, worked out once from the settings above
+        # (the SMS goes out as an email to the carrier gateway, so it needs a mail route too)
+        can_send_mail = self.use_sendgrid or bool(self.email_from and self.email_password)
+        self.email_enabled = can_send_mail and bool(self.email_to)
+        self.sms_enabled = can_send_mail and bool(self.sms_email) and '@' in self.sms_email
+        if self.sms_email and '@' not in self.sms_email:
+            logger.warning("SMS email gateway format not recognized. Use format: phone@carrier.com")
+        
+        # Idle logged-in SMTP connections, and how many are open in total
+        self._smtp_idle: List[PooledSMTP] = []
+        self._smtp_open = 0
+        self._smtp_available = threading.Condition()
         
+        # Keep-alive HTTPS session shared by all SendGrid sends
+        self._sendgrid_session = None
+        if self.use_sendgrid:
+            self._sendgrid_session = requests.Session()
+            self._sendgrid_session.headers["Authorization"] = f"Bearer {self.sendgrid_api_key}"
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def close(self):
+        """Close the SMTP connection and SendGrid session if open."""
+        if self._sendgrid_session is not None:
+            self._sendgrid_session.close()
+        
+        with self._smtp_available:
+            idle, self._smtp_idle = self._smtp_idle, []
+            self._smtp_open -= len(idle)
+        for conn in idle:
+            conn.quit()
+    
     def send_email(self, subject: str, body: str, to_email: Optional[str] = None) -> bool:
         """Send email notification.
         
@@ -99,8 +250,8 @@ class NotificationSender:
                 plain_text_content=body
             )
             
-            sg = SendGridAPIClient(self.sendgrid_api_key)
-            response = sg.send(message)
+            response = self._sendgrid_session.post(SENDGRID_SEND_URL, json=message.get(), timeout=15)
+            response.raise_for_status()
             
             logger.info(f"Email notification sent via SendGrid to {to_email} (status: {response.status_code})")
             return True
@@ -109,6 +260,55 @@ class NotificationSender:
             logger.error(f"Failed to send email via SendGrid: {e}")
             return False
     
+    def _acquire_smtp(self) -> PooledSMTP:
+        """Take an idle SMTP connection from the pool, or open one if under SMTP_POOL_MAX.
+        
+        Waits for a connection to be released when the pool is full. An idle
+        connection the server has dropped is replaced.
+        """
+        with self._smtp_available:
+            while not self._smtp_idle and self._smtp_open >= SMTP_POOL_MAX:
+                self._smtp_available.wait()
+            conn = self._smtp_idle.pop() if self._smtp_idle else None
+            if conn is None:
+                self._smtp_open += 1
+        
+        if conn is not None:
+            try:
+                conn.server.noop()
+                return conn
+            except (smtplib.SMTPException, OSError):
+                logger.debug("SMTP connection dropped, reconnecting")
+                conn.server.close()
+        
+        try:
+            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+            try:
+                server.starttls()
+                server.login(self.email_from, self.email_password)
+            except Exception:
+                server.close()
+                raise
+        except Exception:
+            self._release_smtp(None)
+            raise
+        return PooledSMTP(server)
+    
+    def _release_smtp(self, conn: Optional[PooledSMTP], reusable: bool = True):
+        """Return a connection to the pool, retiring it if it is broken or expired.
+        
+        Pass None to give back the pool slot of a connection that failed to open.
+        """
+        retire = conn is None or not reusable or conn.expired()
+        if conn is not None and retire:
+            conn.quit()
+        with self._smtp_available:
+            if retire:
+                self._smtp_open -= 1
+            else:
+                self._smtp_idle.append(conn)
+            self._smtp_available.notify()
+    
     def _send_email_smtp(self, subject: str, body: str, to_email: str) -> bool:
         """Send email using SMTP."""
         try:
@@ -119,10 +319,14 @@ class NotificationSender:
             
             msg.attach(MIMEText(body, 'plain'))
             
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.email_from, self.email_password)
-                server.send_message(msg)
+            conn = self._acquire_smtp()
+            try:
+                conn.server.send_message(msg)
+            except Exception:
+                self._release_smtp(conn, reusable=False)
+                raise
+            conn.messages_sent += 1
+            self._release_smtp(conn)
             
             logger.info(f"Email notification sent via SMTP to {to_email}")
             return True
@@ -157,6 +361,29 @@ class NotificationSender:
             logger.warning("SMS email gateway format not recognized. Use format: phone@carrier.com")
             return False
     
+    def _send_email_and_sms(self, subject: str, body: str, sms_msg: Optional[str]) -> bool:
+        """Send the email and the SMS at the same time, skipping channels that aren't configured.
+        
+        Returns:
+            True if either was sent
+        """
+        send_sms = self.sms_enabled and bool(sms_msg)
+        if not send_sms:
+            if not self.email_enabled:
+                logger.warning("No notification channel configured. Skipping notification.")
+                return False
+            return self.send_email(subject, body)
+        if not self.email_enabled:
+            return self.send_sms(sms_msg)
+        
+        # Email on a helper thread, SMS on this one
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='notify-email') as pool:
+            email_future = pool.submit(self.send_email, subject, body)
+            sms_sent = self.send_sms(sms_msg)
+            email_sent = email_future.result()
+        
+        return email_sent or sms_sent
+    
     def send_booking_notification(
         self, 
         success: bool, 
@@ -179,56 +406,30 @@ class NotificationSender:
         
         if success and booking_details:
             subject = f"✅ Tennis Bot: Booking Successful - {booking_details.get('court_name', 'Unknown')}"
-            body = f"""Tennis Booking Bot - Booking Result
-
-Status: ✅ SUCCESS
-Time: {timestamp}
-
-Booking Details:
-  Court: {booking_details.get('court_name', 'Unknown')}
-  Date: {booking_details.get('date', 'Unknown')}
-  Time: {booking_details.get('time', 'Unknown')}
-
-The booking was completed successfully!
-"""
+            body = BOOKING_SUCCESS_TEMPLATE.substitute(
+                timestamp=timestamp,
+                court_name=booking_details.get('court_name', 'Unknown'),
+                date=booking_details.get('date', 'Unknown'),
+                time=booking_details.get('time', 'Unknown')
+            )
         else:
             subject = "❌ Tennis Bot: Booking Failed"
-            body = f"""Tennis Booking Bot - Booking Result
-
-Status: ❌ FAILED
-Time: {timestamp}
-
-The booking attempt did not succeed.
-
-"""
-            if error_message:
-                body += f"Error: {error_message}\n\n"
-            else:
-                body += "Possible reasons:\n"
-                body += "  - No slots available at target times\n"
-                body += "  - All slots were already booked\n"
-                body += "  - Booking process encountered an error\n\n"
+            reason = f"Error: {error_message}\n\n" if error_message else BOOKING_FAILED_REASONS
+            body = BOOKING_FAILED_TEMPLATE.substitute(timestamp=timestamp, reason=reason)
         
         # Add log lines if provided
         if log_lines:
-            body += "\n" + "=" * 60 + "\n"
-            body += "Recent Log Output:\n"
-            body += "=" * 60 + "\n"
-            body += "\n".join(log_lines[-50:])  # Last 50 lines
-            body += "\n" + "=" * 60 + "\n"
-        
-        # Try email first
-        email_sent = self.send_email(subject, body)
+            log_tail = "\n".join(log_lines[-LOG_TAIL_LINES:])
+            body += f"\n{LOG_RULE}\nRecent Log Output:\n{LOG_RULE}\n{log_tail}\n{LOG_RULE}\n"
         
-        # Also try SMS if configured
-        sms_sent = False
-        if self.sms_email:
+        # Email, plus SMS if configured
+        sms_msg = None
+        if self.sms_enabled:
             sms_msg = f"Tennis Bot: {'✅ Booked' if success else '❌ Failed'} - {timestamp}"
             if success and booking_details:
                 sms_msg += f" {booking_details.get('court_name')} {booking_details.get('time')}"
-            sms_sent = self.send_sms(sms_msg)
         
-        return email_sent or sms_sent
+        return self._send_email_and_sms(subject, body, sms_msg)
     
     def send_auth_status_notification(self, is_authenticated: bool, details: str = "") -> bool:
         """Send authentication status notification.
@@ -244,41 +445,24 @@ The booking attempt did not succeed.
         
         if is_authenticated:
             subject = "✅ Tennis Bot: Authentication Working"
-            body = f"""Tennis Booking Bot - Authentication Status
-
-Status: ✅ WORKING
-Time: {timestamp}
-
-Authentication is working correctly. The bot is ready to book courts.
-
-{details}
-"""
+            body = AUTH_OK_TEMPLATE.substitute(timestamp=timestamp, details=details)
         else:
             subject = "❌ Tennis Bot: Authentication Failed"
-            body = f"""Tennis Booking Bot - Authentication Status
-
-Status: ❌ FAILED
-Time: {timestamp}
-
-Authentication has failed. The bot cannot book courts.
+            body = AUTH_FAILED_TEMPLATE.substitute(timestamp=timestamp, details=details)
+        
+        # Email, plus SMS if configured
+        sms_msg = f"Tennis Bot: {'✅ Auth OK' if is_authenticated else '❌ Auth Failed'} - {timestamp}"
+        return self._send_email_and_sms(subject, body, sms_msg)
 
-{details}
 
-Action Required:
-1. Check the VM logs: bash scripts/monitoring/view_vm_logs.sh
-2. Re-authenticate: bash scripts/auth/reauth_vm.sh
-3. Check keep-alive service: bash scripts/auth/view_auth_keepalive_log.sh
-"""
-        
-        # Try email first
-        email_sent = self.send_email(subject, body)
-        
-        # Also try SMS if configured
-        sms_sent = False
-        if self.sms_email:
-            sms_sent = self.send_sms(f"Tennis Bot: {'✅ Auth OK' if is_authenticated else '❌ Auth Failed'} - {timestamp}")
-        
-        return email_sent or sms_sent
+@functools.lru_cache(maxsize=1)
+def get_notification_sender() -> NotificationSender:
+    """Get the process-wide NotificationSender.
+    
+    Settings are read from the environment on the first call (after .env
+    has been loaded), and its connection pools are shared by every caller.
+    """
+    return NotificationSender()
 
 
 def get_carrier_sms_gateway(phone_number: str, carrier: str) -> str:
@@ -291,18 +475,9 @@ def get_carrier_sms_gateway(phone_number: str, carrier: str) -> str:
     Returns:
         Email address for SMS gateway
     """
-    carriers = {
-        'att': '@txt.att.net',
-        'verizon': '@vtext.com',
-        'tmobile': '@tmomail.net',
-        'sprint': '@messaging.sprintpcs.com',
-        'uscellular': '@email.uscc.net',
-        'cricket': '@sms.cricketwireless.net',
-    }
-    
-    gateway = carriers.get(carrier.lower())
-    if not gateway:
-        raise ValueError(f"Unknown carrier: {carrier}. Supported: {', '.join(carriers.keys())}")
+    gateway = CARRIER_SMS_GATEWAYS.get(carrier.lower())
+    if gateway is None:
+        raise ValueError(f"Unknown carrier: {carrier}. Supported: {SUPPORTED_CARRIERS}")
     
     return f"{phone_number}{gateway}"
 
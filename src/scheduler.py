@@ -1,29 +1,71 @@
 """Scheduler for running bookings at specific times."""
 import logging
+import math
 import schedule
 import time
-from datetime import datetime
-from typing import Callable, List
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional
 from .config_loader import Config
 
 logger = logging.getLogger(__name__)
 
+# Use ntplib to measure the local clock's offset at start-up if installed (optional)
+try:
+    import ntplib
+    NTPLIB_AVAILABLE = True
+except ImportError:
+    NTPLIB_AVAILABLE = False
+
+# Largest clock offset corrected for when firing a booking at the true start of the hour
+MAX_CLOCK_OFFSET_SECONDS = 5
+
+# Longest single sleep while waiting for the next job. The time left is re-read
+# from the wall clock after each sleep, so an NTP step or a VM suspend/resume
+# shifts the wake-up by at most this much.
+MAX_IDLE_SLEEP_SECONDS = 30
+
 
 class BookingScheduler:
     """Schedules and manages booking tasks."""
     
-    def __init__(self, config: Config, booking_function: Callable):
+    def __init__(self, config: Config, booking_function: Callable, prewarm_function: Optional[Callable] = None):
         """Initialize scheduler.
         
         Args:
             config: Configuration object
             booking_function: Function to call when it's time to book
+            prewarm_function: Optional function to call scheduler.prewarm_seconds
+                before each booking, to get setup work off the critical path
         """
         self.config = config
         self.booking_function = booking_function
+        self.prewarm_function = prewarm_function
+        self.prewarm_seconds = config.scheduler.get('prewarm_seconds', 30)
         self.booking_times = config.booking_times
+        # Seconds to add to the local clock to get NTP time (0 if not measured)
+        self.clock_offset = self._measure_clock_offset(config.scheduler.get('ntp_server'))
         self._setup_schedule()
     
+    def _measure_clock_offset(self, ntp_server: Optional[str]) -> float:
+        """Measure how far the local clock is from ntp_server, once at start-up."""
+        if not ntp_server:
+            return 0.0
+        if not NTPLIB_AVAILABLE:
+            logger.info("ntplib not installed; booking times follow the local clock")
+            return 0.0
+        
+        try:
+            offset = ntplib.NTPClient().request(ntp_server, version=3, timeout=2).offset
+        except Exception as e:
+            logger.warning(f"Could not measure clock offset against {ntp_server}: {e}")
+            return 0.0
+        
+        if abs(offset) > MAX_CLOCK_OFFSET_SECONDS:
+            logger.warning(f"Local clock is {offset:+.3f}s off {ntp_server}; not correcting for it")
+            return 0.0
+        logger.info(f"Local clock offset from {ntp_server}: {offset * 1000:+.0f} ms")
+        return offset
+    
     def _setup_schedule(self):
         """Set up scheduled jobs for each booking time.
         
@@ -38,8 +80,13 @@ class BookingScheduler:
                 minute = int(minute)
                 
                 # Schedule daily at this exact time
-                # Slots open on the hour, so we schedule at :00 to book immediately
-                schedule.every().day.at(f"{hour:02d}:{minute:02d}").do(
+                # Slots open on the hour, so we schedule at :00 to book immediately.
+                # A local clock running behind NTP time is made up for by firing
+                # that many (whole) seconds early; _run_booking waits out the rest.
+                fire_at = datetime(2000, 1, 1, hour, minute)
+                if self.clock_offset > 0:
+                    fire_at -= timedelta(seconds=math.ceil(self.clock_offset))
+                schedule.every().day.at(fire_at.strftime('%H:%M:%S')).do(
                     self._run_booking,
                     booking_time=booking_time
                 )
@@ -51,28 +98,84 @@ class BookingScheduler:
         """Run booking for a specific time.
         
         Note: This runs exactly on the hour when slots become available.
-        A small delay (2 seconds) is added to ensure the slot is available.
+        With a measured clock offset, the booking starts at the slot time by
+        the NTP clock rather than the local one: the job is scheduled early
+        enough for a clock running behind, and this waits until the NTP
+        slot time, never starting early.
         """
-        import time as time_module
-        logger.info(f"Running scheduled booking for {booking_time} (slots just opened)")
+        if self.clock_offset:
+            hour, minute = booking_time.split(':')
+            now = time.time() + self.clock_offset
+            opens_at = datetime.fromtimestamp(now).replace(hour=int(hour), minute=int(minute), second=0, microsecond=0)
+            if opens_at.timestamp() < now - 12 * 3600:
+                # Fired just before midnight for a 00:00 booking
+                opens_at += timedelta(days=1)
+            ahead = opens_at.timestamp() - now
+            if 0 < ahead <= MAX_CLOCK_OFFSET_SECONDS + 1:
+                time.sleep(ahead)
         
-        # Small delay to ensure slot is available (slots open exactly on the hour)
-        time_module.sleep(2)
+        logger.info(f"Running scheduled booking for {booking_time} (slots just opened)")
         
         try:
             self.booking_function()
         except Exception as e:
             logger.error(f"Error in scheduled booking: {e}")
     
+    def next_fire_datetime(self) -> Optional[datetime]:
+        """Get when the next scheduled booking will fire (None if nothing is scheduled)."""
+        return schedule.next_run()
+    
     def run_continuously(self):
-        """Run scheduler continuously, checking for scheduled jobs."""
+        """Run scheduler continuously, checking for scheduled jobs.
+        
+        With scheduler.precise (the default) the polling interval shrinks as
+        the next job gets closer: sleeps of up to MAX_IDLE_SLEEP_SECONDS while
+        it is far off, a single sleep to the pre-warm point or one second early,
+        then a 5 ms poll in the last second. Otherwise it polls every
+        check_interval_minutes.
+        """
         check_interval = self.config.scheduler['check_interval_minutes']
-        logger.info(f"Starting scheduler (checking every {check_interval} minute(s))")
         logger.info(f"Scheduled times: {', '.join(self.booking_times)}")
         
+        if not self.config.scheduler.get('precise', True):
+            logger.info(f"Starting scheduler (checking every {check_interval} minute(s))")
+            while True:
+                schedule.run_pending()
+                time.sleep(check_interval * 60)  # Convert minutes to seconds
+        
+        logger.info("Starting scheduler (sleeping until each scheduled time)")
+        prewarmed_for = None
         while True:
+            idle = schedule.idle_seconds()
+            if idle is None:
+                # Nothing scheduled; check back later
+                time.sleep(check_interval * 60)
+                continue
+            
+            next_run = schedule.next_run()
+            needs_prewarm = (
+                self.prewarm_function is not None and self.prewarm_seconds > 0
+                and prewarmed_for != next_run
+            )
+            if needs_prewarm and idle <= self.prewarm_seconds:
+                prewarmed_for = next_run
+                logger.info(f"Pre-warming for booking at {next_run.strftime('%H:%M')}")
+                try:
+                    self.prewarm_function()
+                except Exception as e:
+                    logger.error(f"Error pre-warming booking: {e}")
+                continue
+            
+            if idle > 2:
+                # Wake up for the pre-warm, or a second early to absorb sleep overshoot
+                wake_after = idle - self.prewarm_seconds if needs_prewarm else idle - 1
+                time.sleep(min(max(wake_after, 0), MAX_IDLE_SLEEP_SECONDS))
+                continue
+            
+            fire_at = time.monotonic() + max(idle, 0)
+            while time.monotonic() < fire_at:
+                time.sleep(0.005)
             schedule.run_pending()
-            time.sleep(check_interval * 60)  # Convert minutes to seconds
     
     def get_next_runs(self) -> List[datetime]:
         """Get list of next scheduled run times."""